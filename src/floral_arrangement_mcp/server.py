@@ -12,8 +12,15 @@ Three-layer architecture:
 """
 
 from fastmcp import FastMCP
+import anyio
+import importlib
 import json
-from typing import Dict, List, Optional, Any
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Final, FrozenSet, List, Optional, Tuple, Any
+
+from . import taxonomy
 
 mcp = FastMCP("floral-arrangement-aesthetics")
 
@@ -21,599 +28,230 @@ mcp = FastMCP("floral-arrangement-aesthetics")
 # LAYER 1: COMPREHENSIVE FLORAL TAXONOMY
 # ============================================================================
 
-ARRANGEMENT_STYLES = {
-    "ikebana": {
-        "moribana": {
-            "description": "Low bowl arrangement, naturalistic landscape",
-            "container": "shallow bowl, suiban",
-            "characteristics": "horizontal emphasis, nature scenery, kenzan pin holder",
-            "balance": "asymmetrical",
-            "complexity": "high"
-        },
-        "nageire": {
-            "description": "Tall vase arrangement, flowing asymmetrical",
-            "container": "tall cylindrical vase",
-            "characteristics": "natural grace, no mechanics visible, stem supports stem",
-            "balance": "asymmetrical",
-            "complexity": "medium"
-        },
-        "rikka": {
-            "description": "Formal standing flowers, classical seven-branch",
-            "container": "bronze or ceramic vase",
-            "characteristics": "symbolic cosmic mountain, rigid structure, ceremonial",
-            "balance": "symmetrical",
-            "complexity": "very high"
-        }
-    },
-    "western_classical": {
-        "cascade": {
-            "description": "Waterfall flow with trailing elements",
-            "container": "elevated pedestal vase or urn",
-            "characteristics": "dramatic downward movement, trailing vines, 1.5x container height drop",
-            "balance": "asymmetrical",
-            "complexity": "high"
-        },
-        "crescent": {
-            "description": "Curved asymmetrical arc, moon-shaped",
-            "container": "low bowl or compote",
-            "characteristics": "graceful curve, negative space emphasis, 60-degree arc",
-            "balance": "asymmetrical",
-            "complexity": "medium"
-        },
-        "hogarth": {
-            "description": "S-curve, line of beauty",
-            "container": "pedestal vase or urn",
-            "characteristics": "flowing S-shape, dynamic movement, elegant proportion",
-            "balance": "asymmetrical",
-            "complexity": "high"
-        },
-        "dome": {
-            "description": "Rounded symmetrical mass",
-            "container": "low bowl, vase, or compote",
-            "characteristics": "equal dimensions all sides, full 360-degree viewing, dense",
-            "balance": "radial symmetrical",
-            "complexity": "low"
-        },
-        "triangular": {
-            "description": "Stable pyramid form",
-            "container": "any stable base",
-            "characteristics": "wide base tapering to point, classical proportion, formal",
-            "balance": "symmetrical",
-            "complexity": "low"
-        },
-        "vertical": {
-            "description": "Tall upright emphasis",
-            "container": "tall narrow vase",
-            "characteristics": "height 2-3x container, upward movement, line flowers dominant",
-            "balance": "symmetrical or asymmetrical",
-            "complexity": "low"
-        },
-        "horizontal": {
-            "description": "Low spreading centerpiece",
-            "container": "long low container or candelabra",
-            "characteristics": "width 3x height, table centerpiece, conversation-friendly",
-            "balance": "symmetrical",
-            "complexity": "medium"
-        }
-    },
-    "contemporary": {
-        "minimalist": {
-            "description": "Few stems, negative space emphasis",
-            "container": "simple geometric vessel",
-            "characteristics": "3-7 stems maximum, sculptural form, breathing space",
-            "balance": "asymmetrical",
-            "complexity": "medium"
-        },
-        "structural": {
-            "description": "Architectural, geometric forms",
-            "container": "modern cube, cylinder, or asymmetric",
-            "characteristics": "bold lines, repetition, graphic shapes, non-traditional materials",
-            "balance": "often asymmetrical",
-            "complexity": "high"
-        },
-        "garden_style": {
-            "description": "Loose, natural, abundant",
-            "container": "rustic basket, vintage vessel",
-            "characteristics": "just-picked feel, varied textures, romantic fullness, organic",
-            "balance": "asymmetrical",
-            "complexity": "medium"
-        },
-        "parallel": {
-            "description": "Stems grouped in vertical lines",
-            "container": "rectangular or cylindrical",
-            "characteristics": "stems visible through glass, grouped bundles, modern clean",
-            "balance": "symmetrical or asymmetrical",
-            "complexity": "low"
-        }
-    }
+# Tables are parsed from packaged JSON on first access (see taxonomy.py)
+
+def __getattr__(name: str) -> Any:
+    """Expose the taxonomy tables as attributes of this module."""
+    if name in taxonomy.TABLES:
+        return getattr(taxonomy, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# ============================================================================
+# KEYWORD SCANNING
+# ============================================================================
+
+# Literal cues the detectors test for, besides the taxonomy's own names
+_STYLE_KEYWORDS = (
+    "ikebana", "japanese", "moribana", "cascade", "waterfall", "trailing",
+    "dome", "round", "centerpiece", "minimal", "modern", "contemporary",
+    "garden", "loose", "natural", "romantic", "crescent", "curve"
+)
+_MOOD_KEYWORDS = (
+    "wedding", "bridal", "romantic", "anniversary", "vibrant", "celebration",
+    "birthday", "elegant", "formal", "bold"
+)
+_SEASON_KEYWORDS = ("spring", "summer", "autumn", "fall", "winter")
+
+def _build_keywords() -> Tuple[str, ...]:
+    """Every keyword a detector tests the intent for, deduplicated."""
+    keywords = dict.fromkeys(_STYLE_KEYWORDS + _MOOD_KEYWORDS + _SEASON_KEYWORDS)
+    keywords.update(dict.fromkeys(taxonomy.COLOR_PALETTES))
+    for flowers in taxonomy.FLOWERS_BY_ROLE.values():
+        keywords.update(dict.fromkeys(name.replace("_", " ") for name in flowers))
+    for types in taxonomy.FOLIAGE_TYPES.values():
+        keywords.update(dict.fromkeys(name.replace("_", " ") for name in types))
+    return tuple(keywords)
+
+_KEYWORDS = _build_keywords()
+
+def _scan_keywords(text: str) -> FrozenSet[str]:
+    """
+    Return every detector keyword occurring in text as a substring.
+
+    One C-level `in` test per keyword, overlaps included (e.g. "fall" inside
+    "waterfall"); for intents of a few hundred characters this beats a single
+    regex alternation, which retries every keyword at each position.
+    """
+    return frozenset([keyword for keyword in _KEYWORDS if keyword in text])
+
+def _build_palette_cue_rank() -> Dict[str, Tuple[int, str]]:
+    """
+    Map each palette cue keyword to (priority, palette).
+
+    Priority follows detect_color_scheme's precedence: an explicit palette
+    name (in table order), then seasons, then mood words. The lowest-ranked
+    cue found in the intent wins.
+    """
+    cues = [(name, name) for name in taxonomy.COLOR_PALETTES]
+    cues += [
+        ("spring", "spring"), ("summer", "summer"),
+        ("autumn", "autumn"), ("fall", "autumn"), ("winter", "winter"),
+        ("romantic", "romantic"), ("wedding", "romantic"),
+        ("elegant", "elegant"), ("formal", "elegant"),
+        ("vibrant", "vibrant"), ("bold", "vibrant"),
+    ]
+    rank: Dict[str, Tuple[int, str]] = {}
+    for priority, (keyword, palette) in enumerate(cues):
+        rank.setdefault(keyword, (priority, palette))
+    return rank
+
+_PALETTE_CUE_RANK = _build_palette_cue_rank()
+
+# Explicit style cues as (cues, required cues or None, category, type), in
+# priority order. The first rule with a cue in the intent wins, provided one of
+# its required cues is there too; moribana needs an ikebana cue alongside it.
+# Any other ikebana intent is nageire, so "nageire" itself is not a cue.
+_STYLE_CUES = frozenset(_STYLE_KEYWORDS)
+_IKEBANA_CUES = frozenset({"ikebana", "japanese"})
+_STYLE_RULES = (
+    (frozenset({"moribana"}), _IKEBANA_CUES, "ikebana", "moribana"),
+    (_IKEBANA_CUES, None, "ikebana", "nageire"),
+    (frozenset({"cascade", "waterfall", "trailing"}), None, "western_classical", "cascade"),
+    (frozenset({"dome", "round", "centerpiece"}), None, "western_classical", "dome"),
+    (frozenset({"minimal", "modern", "contemporary"}), None, "contemporary", "minimalist"),
+    (frozenset({"garden", "loose", "natural", "romantic"}), None, "contemporary", "garden_style"),
+    (frozenset({"crescent", "curve"}), None, "western_classical", "crescent"),
+)
+
+# ============================================================================
+# PRECOMPUTED DETECTOR ENTRIES
+# ============================================================================
+
+# Flower roles in the order results list them
+_ROLES: Final[Tuple[str, ...]] = ("focal", "line", "filler", "texture")
+
+# Result entries ({"name", "role"/"category", **data}) are built once and
+# shared by reference across requests, so they are frozen like the tables.
+_FLOWER_ENTRY = taxonomy.FrozenDict({
+    role: taxonomy.FrozenDict({
+        name: taxonomy.FrozenDict({"name": name.replace("_", " "), "role": role, **data})
+        for name, data in flowers.items()
+    })
+    for role, flowers in taxonomy.FLOWERS_BY_ROLE.items()
+})
+
+_FOLIAGE_ENTRY = taxonomy.FrozenDict({
+    category: taxonomy.FrozenDict({
+        name: taxonomy.FrozenDict({"name": name.replace("_", " "), "category": category, **data})
+        for name, data in types.items()
+    })
+    for category, types in taxonomy.FOLIAGE_TYPES.items()
+})
+
+_STYLE_ENTRY = taxonomy.FrozenDict({
+    category: taxonomy.FrozenDict({
+        name: taxonomy.FrozenDict({"category": category, "type": name, **data})
+        for name, data in styles.items()
+    })
+    for category, styles in taxonomy.ARRANGEMENT_STYLES.items()
+})
+
+_PALETTE_ENTRY = taxonomy.FrozenDict({
+    name: taxonomy.FrozenDict({"palette": name, **data})
+    for name, data in taxonomy.COLOR_PALETTES.items()
+})
+
+# Display name -> (catalog rank, role, flower key) for explicit mentions
+_FLOWER_KEYWORD_INDEX = {
+    entry["name"]: (rank, entry["role"], name)
+    for rank, (name, entry) in enumerate(
+        item for entries in _FLOWER_ENTRY.values() for item in entries.items()
+    )
 }
 
-FLOWERS_BY_ROLE = {
-    "focal": {
-        "roses": {
-            "types": ["garden roses", "spray roses", "hybrid tea", "English roses"],
-            "characteristics": "classic beauty, layered petals, focal point dominance",
-            "color_range": "full spectrum",
-            "size": "large 3-5 inches",
-            "seasons": ["spring", "summer", "fall"],
-            "symbolism": "love, romance, elegance"
-        },
-        "peonies": {
-            "types": ["herbaceous", "tree peony", "Itoh hybrid"],
-            "characteristics": "lush ruffled petals, full bloom drama, short season",
-            "color_range": "white, pink, coral, burgundy",
-            "size": "very large 4-6 inches",
-            "seasons": ["late spring", "early summer"],
-            "symbolism": "prosperity, honor, romance"
-        },
-        "lilies": {
-            "types": ["oriental", "asiatic", "calla", "trumpet"],
-            "characteristics": "dramatic form, strong fragrance (oriental), architectural",
-            "color_range": "full spectrum",
-            "size": "large 4-6 inches per bloom",
-            "seasons": ["summer", "fall"],
-            "symbolism": "purity, majesty, sophistication"
-        },
-        "orchids": {
-            "types": ["phalaenopsis", "cymbidium", "dendrobium", "vanda"],
-            "characteristics": "exotic elegance, long-lasting, tropical",
-            "color_range": "white, pink, purple, yellow, green",
-            "size": "medium 2-4 inches",
-            "seasons": ["year-round"],
-            "symbolism": "luxury, refinement, beauty"
-        },
-        "hydrangeas": {
-            "types": ["mophead", "lacecap", "paniculata", "oakleaf"],
-            "characteristics": "full mass, color-changing, garden feel",
-            "color_range": "blue, pink, white, green, purple",
-            "size": "very large 6-8 inch heads",
-            "seasons": ["summer", "fall"],
-            "symbolism": "gratitude, abundance, heartfelt emotion"
-        },
-        "sunflowers": {
-            "types": ["giant", "teddy bear", "moulin rouge", "autumn beauty"],
-            "characteristics": "bold face, cheerful, rustic charm",
-            "color_range": "yellow, orange, burgundy, bronze",
-            "size": "large 4-10 inches",
-            "seasons": ["summer", "fall"],
-            "symbolism": "happiness, loyalty, longevity"
-        },
-        "dahlias": {
-            "types": ["dinner plate", "cactus", "pompon", "decorative"],
-            "characteristics": "geometric petals, bold color, garden luxury",
-            "color_range": "full spectrum except blue",
-            "size": "small to very large 2-10 inches",
-            "seasons": ["late summer", "fall"],
-            "symbolism": "elegance, dignity, commitment"
-        }
-    },
-    "line": {
-        "snapdragons": {
-            "characteristics": "vertical spikes, graduated blooms, height emphasis",
-            "color_range": "full spectrum",
-            "height": "18-36 inches",
-            "use": "creates vertical movement and height"
-        },
-        "delphiniums": {
-            "characteristics": "tall elegant columns, cottage garden feel",
-            "color_range": "blue, purple, pink, white",
-            "height": "24-48 inches",
-            "use": "dramatic height, romantic spires"
-        },
-        "gladiolus": {
-            "characteristics": "sword-like stems, formal linear",
-            "color_range": "full spectrum",
-            "height": "24-60 inches",
-            "use": "strong vertical lines, classical elegance"
-        },
-        "liatris": {
-            "characteristics": "fuzzy textured spikes, blooms top-down",
-            "color_range": "purple, white",
-            "height": "18-36 inches",
-            "use": "unique texture, prairie wildflower feel"
-        },
-        "bells_of_ireland": {
-            "characteristics": "green architectural spires, shell-like calyxes",
-            "color_range": "lime green",
-            "height": "24-36 inches",
-            "use": "fresh green accent, Irish symbolism"
-        },
-        "stock": {
-            "characteristics": "fragrant vertical clusters, cottage garden",
-            "color_range": "white, pink, purple, lavender",
-            "height": "18-30 inches",
-            "use": "fragrance, soft spires, romantic"
-        }
-    },
-    "filler": {
-        "baby_breath": {
-            "characteristics": "cloud-like delicate, tiny white blooms",
-            "use": "softens arrangements, creates airiness, classic filler",
-            "texture": "fine, misty"
-        },
-        "waxflower": {
-            "characteristics": "tiny clustered blooms, long-lasting, waxy texture",
-            "color_range": "white, pink, purple",
-            "use": "elegant filler, wedding favorite"
-        },
-        "statice": {
-            "characteristics": "papery textured, long-lasting, dried feel",
-            "color_range": "purple, white, yellow, pink",
-            "use": "texture contrast, everlasting quality"
-        },
-        "solidago": {
-            "characteristics": "golden plumes, wild meadow feel",
-            "color_range": "yellow, gold",
-            "use": "fall arrangements, cheerful accent"
-        },
-        "alstroemeria": {
-            "characteristics": "small lily-like, long vase life, multiple blooms",
-            "color_range": "full spectrum",
-            "use": "versatile filler, budget-friendly"
-        },
-        "hypericum": {
-            "characteristics": "berry-like, unique texture",
-            "color_range": "red, burgundy, white, green",
-            "use": "adds interest, festive accent"
-        }
-    },
-    "texture": {
-        "thistle": {
-            "characteristics": "spiky, architectural, edgy",
-            "color_range": "purple, blue, white",
-            "use": "modern edge, texture contrast"
-        },
-        "protea": {
-            "characteristics": "bold sculptural, exotic",
-            "color_range": "pink, coral, cream",
-            "use": "focal drama, tropical luxury"
-        },
-        "scabiosa": {
-            "characteristics": "pincushion center, whimsical",
-            "color_range": "deep burgundy, purple, white",
-            "use": "unique texture, romantic gardens"
-        },
-        "ranunculus": {
-            "characteristics": "layered tissue-paper petals, romantic",
-            "color_range": "full spectrum",
-            "use": "texture richness, elegant beauty"
-        }
-    }
+# Wedding suggestions name the roses more specifically
+_GARDEN_ROSES_ENTRY = taxonomy.FrozenDict(
+    {**_FLOWER_ENTRY["focal"]["roses"], "name": "garden roses"}
+)
+
+# Structural technique dispatch for map_structure, keyed by the style's balance,
+# its type or (category, type); anything unlisted gets the default
+_BALANCE_BY_STYLE = {
+    "symmetrical": taxonomy.STRUCTURAL_TECHNIQUES["balance"]["symmetrical_radial"],
+    "radial symmetrical": taxonomy.STRUCTURAL_TECHNIQUES["balance"]["symmetrical_radial"],
 }
+_DEFAULT_BALANCE = taxonomy.STRUCTURAL_TECHNIQUES["balance"]["asymmetrical"]
 
-FOLIAGE_TYPES = {
-    "structural": {
-        "ferns": {
-            "types": ["leather fern", "tree fern", "sword fern"],
-            "characteristics": "feathery fronds, classical backdrop",
-            "use": "traditional base, soft texture"
-        },
-        "eucalyptus": {
-            "types": ["seeded", "silver dollar", "baby blue"],
-            "characteristics": "silvery-blue leaves, aromatic, trendy",
-            "use": "modern texture, color accent, fragrance"
-        },
-        "ruscus": {
-            "characteristics": "glossy pointed leaves, sturdy stems",
-            "use": "foundation greenery, long-lasting"
-        },
-        "salal": {
-            "characteristics": "rounded glossy leaves, pacific northwest",
-            "use": "backdrop greenery, filler"
-        }
-    },
-    "accent": {
-        "ivy": {
-            "types": ["English ivy", "variegated ivy"],
-            "characteristics": "trailing vines, romantic drape",
-            "use": "softens edges, cascading effect"
-        },
-        "pittosporum": {
-            "characteristics": "small rounded leaves, delicate sprays",
-            "use": "airy filler, soft texture"
-        },
-        "dusty_miller": {
-            "characteristics": "silvery fuzzy leaves, soft focus",
-            "use": "color contrast, romantic softness"
-        },
-        "olive_branches": {
-            "characteristics": "silvery-green, Mediterranean, symbolic",
-            "use": "rustic elegance, peace symbolism"
-        }
-    },
-    "dramatic": {
-        "monstera": {
-            "characteristics": "large split leaves, tropical bold",
-            "use": "modern drama, tropical theme"
-        },
-        "palm": {
-            "types": ["fan palm", "phoenix palm"],
-            "characteristics": "architectural fronds, tropical",
-            "use": "bold statement, event decor"
-        },
-        "aspidistra": {
-            "characteristics": "large blade leaves, manipulable",
-            "use": "wraps, structural elements"
-        }
-    }
+_MOVEMENT_BY_TYPE = {
+    "cascade": taxonomy.STRUCTURAL_TECHNIQUES["movement"]["cascade_fall"],
+    "vertical": taxonomy.STRUCTURAL_TECHNIQUES["movement"]["vertical_lift"],
+    "horizontal": taxonomy.STRUCTURAL_TECHNIQUES["movement"]["horizontal_sweep"],
 }
+_DEFAULT_MOVEMENT = taxonomy.STRUCTURAL_TECHNIQUES["movement"]["spiral_rotation"]
 
-COLOR_PALETTES = {
-    "monochromatic": {
-        "description": "Single color in varying shades and tints",
-        "examples": ["all white", "blush to deep pink", "cream to chocolate"],
-        "effect": "sophisticated, cohesive, elegant",
-        "occasions": ["wedding", "formal", "minimalist"]
-    },
-    "analogous": {
-        "description": "Colors adjacent on color wheel",
-        "examples": ["yellow-orange-red", "blue-purple-violet", "yellow-green-blue"],
-        "effect": "harmonious, natural, pleasing",
-        "occasions": ["everyday", "celebration", "garden-style"]
-    },
-    "complementary": {
-        "description": "Opposite colors on wheel",
-        "examples": ["purple-yellow", "blue-orange", "red-green"],
-        "effect": "vibrant, energetic, bold contrast",
-        "occasions": ["celebration", "modern", "attention-grabbing"]
-    },
-    "triadic": {
-        "description": "Three colors evenly spaced on wheel",
-        "examples": ["red-yellow-blue", "orange-green-purple"],
-        "effect": "vibrant, balanced, rich",
-        "occasions": ["festive", "children", "joyful"]
-    },
-    "romantic": {
-        "colors": ["blush pink", "cream", "soft peach", "ivory", "champagne"],
-        "effect": "soft, dreamy, feminine, gentle",
-        "occasions": ["wedding", "bridal shower", "anniversary"]
-    },
-    "elegant": {
-        "colors": ["deep burgundy", "cream", "forest green", "white", "gold accent"],
-        "effect": "sophisticated, refined, formal",
-        "occasions": ["gala", "formal dinner", "luxury events"]
-    },
-    "vibrant": {
-        "colors": ["magenta", "orange", "hot pink", "yellow", "coral"],
-        "effect": "energetic, joyful, bold",
-        "occasions": ["birthday", "tropical", "celebration"]
-    },
-    "spring": {
-        "colors": ["tulip yellow", "daffodil", "lavender", "soft pink", "fresh green"],
-        "effect": "fresh, renewal, optimistic",
-        "seasons": ["spring"],
-        "occasions": ["easter", "spring wedding"]
-    },
-    "summer": {
-        "colors": ["bright yellow", "coral", "hot pink", "orange", "lime green"],
-        "effect": "warm, abundant, lively",
-        "seasons": ["summer"],
-        "occasions": ["garden party", "outdoor celebration"]
-    },
-    "autumn": {
-        "colors": ["rust orange", "burgundy", "golden yellow", "bronze", "deep red"],
-        "effect": "warm, rich, harvest",
-        "seasons": ["fall"],
-        "occasions": ["thanksgiving", "fall wedding"]
-    },
-    "winter": {
-        "colors": ["deep red", "white", "evergreen", "silver", "navy"],
-        "effect": "crisp, festive, elegant",
-        "seasons": ["winter"],
-        "occasions": ["christmas", "winter formal"]
-    }
+_FOCAL_BY_STYLE = {
+    ("contemporary", "minimalist"): (
+        taxonomy.STRUCTURAL_TECHNIQUES["focal_points"]["single_dominant"]
+    ),
 }
+_DEFAULT_FOCAL = taxonomy.STRUCTURAL_TECHNIQUES["focal_points"]["multiple_secondary"]
 
-STRUCTURAL_TECHNIQUES = {
-    "balance": {
-        "symmetrical_radial": {
-            "description": "Equal visual weight radiating from center",
-            "arrangements": ["dome", "round", "triangular"],
-            "effect": "formal, stable, traditional"
-        },
-        "symmetrical_bilateral": {
-            "description": "Mirror image left and right",
-            "arrangements": ["triangular", "vertical", "fan"],
-            "effect": "formal, classical, orderly"
-        },
-        "asymmetrical": {
-            "description": "Unequal but balanced visual weight",
-            "arrangements": ["crescent", "hogarth", "ikebana"],
-            "effect": "dynamic, natural, contemporary"
-        }
-    },
-    "proportion": {
-        "golden_ratio": {
-            "description": "1.618:1 ratio between elements",
-            "application": "height to width, focal to filler, container to arrangement"
-        },
-        "rule_of_thirds": {
-            "description": "Divide into thirds horizontally and vertically",
-            "application": "place focal points at intersections"
-        },
-        "height_to_container": {
-            "traditional": "1.5 to 2 times container height",
-            "modern": "can break rules for dramatic effect",
-            "horizontal": "container height to arrangement width 1:3"
-        }
-    },
-    "focal_points": {
-        "single_dominant": {
-            "description": "One clear center of interest",
-            "technique": "largest bloom at center or asymmetric position",
-            "effect": "clear hierarchy, classical"
-        },
-        "multiple_secondary": {
-            "description": "Primary focal with supporting accents",
-            "technique": "triangle of focal flowers",
-            "effect": "visual journey, sophisticated"
-        },
-        "distributed": {
-            "description": "Interest spread throughout",
-            "technique": "no single dominant element",
-            "effect": "garden-style, natural"
-        }
-    },
-    "movement": {
-        "vertical_lift": {
-            "description": "Upward reaching energy",
-            "technique": "line flowers, tall stems, upright forms",
-            "effect": "aspiration, celebration, growth"
-        },
-        "horizontal_sweep": {
-            "description": "Side-to-side flow",
-            "technique": "trailing elements, lateral branches",
-            "effect": "calm, peaceful, grounding"
-        },
-        "spiral_rotation": {
-            "description": "Circular flow around center",
-            "technique": "stems arranged in spiral, flowers face different directions",
-            "effect": "dynamic, natural, garden-style"
-        },
-        "cascade_fall": {
-            "description": "Downward waterfall motion",
-            "technique": "trailing ivy, hanging amaranthus, weighted bottom",
-            "effect": "drama, elegance, gravity"
-        },
-        "radiation": {
-            "description": "Outward burst from center",
-            "technique": "stems angle out from central point",
-            "effect": "energy, explosion, celebration"
-        }
-    },
-    "texture": {
-        "smooth_rough_contrast": {
-            "description": "Juxtapose sleek and textured elements",
-            "examples": "glossy calla lilies with spiky thistle",
-            "effect": "visual interest, sophisticated"
-        },
-        "delicate_bold_mix": {
-            "description": "Combine fine and substantial forms",
-            "examples": "baby's breath with large roses",
-            "effect": "balance, dimension"
-        },
-        "monochromatic_texture": {
-            "description": "Same color, varied textures",
-            "examples": "white roses, ranunculus, stock, baby's breath",
-            "effect": "subtle sophistication, cohesive"
-        }
-    },
-    "density": {
-        "packed_abundant": {
-            "description": "Full mass, minimal negative space",
-            "style": "European garden, romantic",
-            "effect": "lush, generous, romantic"
-        },
-        "airy_spacious": {
-            "description": "Minimal stems, maximum negative space",
-            "style": "Ikebana, contemporary minimalist",
-            "effect": "elegant, modern, sculptural"
-        },
-        "clustered_with_voids": {
-            "description": "Dense groupings separated by open space",
-            "style": "Contemporary, structural",
-            "effect": "drama, graphic, intentional"
-        }
-    }
+_DENSITY_BY_STYLE = {
+    ("contemporary", "minimalist"): taxonomy.STRUCTURAL_TECHNIQUES["density"]["airy_spacious"],
+    ("contemporary", "garden_style"): taxonomy.STRUCTURAL_TECHNIQUES["density"]["packed_abundant"],
 }
+_DEFAULT_DENSITY = taxonomy.STRUCTURAL_TECHNIQUES["density"]["clustered_with_voids"]
 
-OCCASIONS = {
-    "wedding": {
-        "ceremony": {
-            "arrangements": ["altar arrangements", "aisle markers", "chuppah flowers"],
-            "styles": ["romantic", "elegant", "dramatic"],
-            "scale": "large, architectural"
-        },
-        "reception": {
-            "arrangements": ["centerpieces", "cake flowers", "sweetheart table"],
-            "styles": ["romantic", "garden-style", "elegant"],
-            "scale": "medium, conversation-friendly"
-        },
-        "bridal_party": {
-            "arrangements": ["bouquets", "boutonnieres", "corsages"],
-            "styles": ["cohesive with ceremony", "hand-tied", "wearable"],
-            "scale": "personal, scaled to person"
-        }
-    },
-    "funeral": {
-        "standing_spray": {
-            "description": "Easel-mounted vertical arrangement",
-            "characteristics": "formal, respectful, traditional symbolism"
-        },
-        "casket_spray": {
-            "description": "Long horizontal arrangement for casket",
-            "characteristics": "full coverage, masculine or feminine styling"
-        },
-        "wreath": {
-            "description": "Circular form symbolizing eternal life",
-            "characteristics": "traditional, symmetrical, symbolic"
-        },
-        "sympathy_basket": {
-            "description": "Comforting arrangement for home",
-            "characteristics": "thoughtful, lasting, garden-style"
-        }
-    },
-    "celebration": {
-        "birthday": {
-            "characteristics": "joyful, colorful, personal to recipient",
-            "styles": ["vibrant", "fun", "favorite colors"]
-        },
-        "anniversary": {
-            "characteristics": "romantic, meaningful, often roses",
-            "styles": ["elegant", "romantic", "traditional flowers"]
-        },
-        "congratulations": {
-            "characteristics": "bright, uplifting, celebratory",
-            "styles": ["vibrant", "contemporary", "bold"]
-        },
-        "get_well": {
-            "characteristics": "cheerful, uplifting, fragrance-free",
-            "styles": ["bright colors", "garden-style", "optimistic"]
-        }
-    },
-    "everyday": {
-        "home_decor": {
-            "characteristics": "seasonally appropriate, complements interior",
-            "styles": ["garden-style", "minimalist", "whatever brings joy"]
-        },
-        "hostess_gift": {
-            "characteristics": "thoughtful, pre-arranged, ready to display",
-            "styles": ["elegant", "seasonal", "generous but not overwhelming"]
-        }
-    }
+_PROPORTION = taxonomy.STRUCTURAL_TECHNIQUES["proportion"]["golden_ratio"]
+_TEXTURE = taxonomy.STRUCTURAL_TECHNIQUES["texture"]["smooth_rough_contrast"]
+
+def _json_shaped(node: Any) -> Any:
+    """Copy of a frozen table node with tuples back as lists, as parsed from JSON."""
+    if isinstance(node, dict):
+        return {key: _json_shaped(value) for key, value in node.items()}
+    if isinstance(node, tuple):
+        return [_json_shaped(item) for item in node]
+    return node
+
+# Lowercased text of each occasion, for free-form substring matches. Rendered
+# from the JSON-shaped data so brackets match the original dict-of-lists text.
+_OCCASION_TEXT = {
+    name: str(_json_shaped(data)).lower() for name, data in taxonomy.OCCASIONS.items()
 }
 
-CULTURAL_TRADITIONS = {
-    "japanese_ikebana": {
-        "philosophy": "minimalism, asymmetry, nature appreciation, spiritual practice",
-        "principles": ["heaven-earth-man triangle", "negative space as important as flowers", "seasonal awareness"],
-        "key_concepts": {
-            "ma": "negative space, pause, interval",
-            "wabi_sabi": "imperfect beauty, transience",
-            "shin_soe_hikae": "primary, secondary, tertiary elements"
-        }
-    },
-    "european_garden": {
-        "philosophy": "abundance, romance, natural beauty",
-        "principles": ["lush fullness", "color harmony", "garden-fresh aesthetic"],
-        "characteristics": "loose, organic, just-picked feel, varied textures"
-    },
-    "victorian": {
-        "philosophy": "language of flowers, tight structure, formal beauty",
-        "principles": ["symbolic meanings", "tight massing", "structured form"],
-        "characteristics": "dense, formal, symbolic, tussie-mussie style"
-    },
-    "contemporary_western": {
-        "philosophy": "artistic expression, breaking tradition, individual style",
-        "principles": ["rule-breaking", "artistic interpretation", "personal expression"],
-        "characteristics": "varied widely, structural, unexpected materials"
-    }
+_OCCASION_MATCH = {
+    name: taxonomy.FrozenDict({name: data}) for name, data in taxonomy.OCCASIONS.items()
+}
+
+def _first_occasion_containing(term: str) -> Optional[str]:
+    """First occasion whose text contains term, in table order."""
+    for name, text in _OCCASION_TEXT.items():
+        if term in text:
+            return name
+    return None
+
+def _occasion_terms(node: Any):
+    """Yield every key, leaf string, phrase and word under an occasion."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield key
+            yield from _occasion_terms(value)
+    elif isinstance(node, (list, tuple)):
+        for item in node:
+            yield from _occasion_terms(item)
+    elif isinstance(node, str):
+        yield node
+        for phrase in node.split(","):
+            yield phrase.strip()
+            yield from phrase.split()
+
+_GENERAL_OCCASION = taxonomy.FrozenDict(
+    {"occasion": "general", "notes": "versatile arrangement suitable for various contexts"}
+)
+
+# Term -> occasion for every term that appears in the data. Each value is what
+# _first_occasion_containing() returns, so a hit here matches the full scan.
+_OCCASION_INDEX = {
+    term: occ_name
+    for term in _occasion_terms(taxonomy.OCCASIONS)
+    if term and (occ_name := _first_occasion_containing(term)) is not None
 }
 
 # ============================================================================
 # LAYER 2: DETERMINISTIC MAPPING FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=1024)
 def map_floral_taxonomy(
     user_intent: str,
     style_preference: str = "any",
@@ -623,20 +261,26 @@ def map_floral_taxonomy(
     """
     Map user intent to floral taxonomy elements.
     Pure deterministic lookup - no LLM needed.
+    
+    Results are memoized and shared between callers, so they are frozen:
+    mappings are FrozenDicts and the flower and foliage lists are tuples.
     """
     intent_lower = user_intent.lower()
     
+    # Single pass over the intent for every keyword the detectors use
+    hits = _scan_keywords(intent_lower)
+    
     # Detect style from intent
-    detected_style = detect_arrangement_style(intent_lower, style_preference)
+    detected_style = detect_arrangement_style(intent_lower, style_preference, hits)
     
     # Detect flowers mentioned or suggest based on occasion
-    detected_flowers = detect_flowers(intent_lower, occasion)
+    detected_flowers = detect_flowers(intent_lower, occasion, hits)
     
     # Detect or suggest foliage
-    detected_foliage = detect_foliage(intent_lower, detected_style)
+    detected_foliage = detect_foliage(intent_lower, detected_style, hits)
     
     # Detect or map color scheme
-    detected_colors = detect_color_scheme(intent_lower, color_scheme, occasion)
+    detected_colors = detect_color_scheme(intent_lower, color_scheme, occasion, hits)
     
     # Map structural techniques
     structure = map_structure(detected_style, detected_colors)
@@ -644,356 +288,290 @@ def map_floral_taxonomy(
     # Detect occasion-specific requirements
     occasion_specs = map_occasion(occasion, detected_style)
     
-    return {
+    return taxonomy.FrozenDict({
         "user_intent": user_intent,
         "style": detected_style,
-        "flowers": detected_flowers,
-        "foliage": detected_foliage,
+        "flowers": taxonomy.FrozenDict(
+            {role: tuple(entries) for role, entries in detected_flowers.items()}
+        ),
+        "foliage": tuple(detected_foliage),
         "colors": detected_colors,
-        "structure": structure,
+        "structure": taxonomy.FrozenDict(structure),
         "occasion": occasion_specs,
         "cultural_context": get_cultural_context(detected_style)
-    }
+    })
 
-def detect_arrangement_style(intent: str, preference: str) -> Dict[str, Any]:
+def detect_arrangement_style(
+    intent: str,
+    preference: str,
+    hits: Optional[FrozenSet[str]] = None
+) -> Dict[str, Any]:
     """Detect or select arrangement style."""
-    # Check for explicit style mentions
-    if "ikebana" in intent or "japanese" in intent:
-        if "moribana" in intent:
-            return {"category": "ikebana", "type": "moribana", **ARRANGEMENT_STYLES["ikebana"]["moribana"]}
-        elif "nageire" in intent:
-            return {"category": "ikebana", "type": "nageire", **ARRANGEMENT_STYLES["ikebana"]["nageire"]}
-        else:
-            return {"category": "ikebana", "type": "nageire", **ARRANGEMENT_STYLES["ikebana"]["nageire"]}
-    
-    if "cascade" in intent or "waterfall" in intent or "trailing" in intent:
-        return {"category": "western_classical", "type": "cascade", **ARRANGEMENT_STYLES["western_classical"]["cascade"]}
-    
-    if "dome" in intent or "round" in intent or "centerpiece" in intent:
-        return {"category": "western_classical", "type": "dome", **ARRANGEMENT_STYLES["western_classical"]["dome"]}
+    if hits is None:
+        hits = _scan_keywords(intent)
     
-    if "minimal" in intent or "modern" in intent or "contemporary" in intent:
-        return {"category": "contemporary", "type": "minimalist", **ARRANGEMENT_STYLES["contemporary"]["minimalist"]}
-    
-    if "garden" in intent or "loose" in intent or "natural" in intent or "romantic" in intent:
-        return {"category": "contemporary", "type": "garden_style", **ARRANGEMENT_STYLES["contemporary"]["garden_style"]}
-    
-    if "crescent" in intent or "curve" in intent:
-        return {"category": "western_classical", "type": "crescent", **ARRANGEMENT_STYLES["western_classical"]["crescent"]}
+    # Check for explicit style mentions
+    style_hits = hits & _STYLE_CUES
+    if style_hits:
+        for cues, requires, category, style_type in _STYLE_RULES:
+            if not cues.isdisjoint(style_hits) and (
+                requires is None or not requires.isdisjoint(style_hits)
+            ):
+                return _STYLE_ENTRY[category][style_type]
     
     # Default based on preference or occasion hints
     if preference != "any":
-        for category, styles in ARRANGEMENT_STYLES.items():
+        for category, styles in _STYLE_ENTRY.items():
             if preference in styles:
-                return {"category": category, "type": preference, **styles[preference]}
+                return styles[preference]
     
     # Default to garden style (most versatile)
-    return {"category": "contemporary", "type": "garden_style", **ARRANGEMENT_STYLES["contemporary"]["garden_style"]}
+    return _STYLE_ENTRY["contemporary"]["garden_style"]
 
-def detect_flowers(intent: str, occasion: str) -> Dict[str, List[Dict]]:
+def detect_flowers(
+    intent: str,
+    occasion: str,
+    hits: Optional[FrozenSet[str]] = None
+) -> Dict[str, List[Dict]]:
     """Detect mentioned flowers or suggest based on occasion."""
-    detected = {"focal": [], "line": [], "filler": [], "texture": []}
-    
+    if hits is None:
+        hits = _scan_keywords(intent)
     # Check for explicit flower mentions
-    for role, flowers in FLOWERS_BY_ROLE.items():
-        for flower_name, flower_data in flowers.items():
-            if flower_name.replace("_", " ") in intent:
-                detected[role].append({
-                    "name": flower_name.replace("_", " "),
-                    "role": role,
-                    **flower_data
-                })
+    # Look up only the keywords that matched; rank keeps catalog order
+    mentioned = sorted(_FLOWER_KEYWORD_INDEX[kw] for kw in hits if kw in _FLOWER_KEYWORD_INDEX)
     
     # If no flowers detected, suggest based on occasion
-    if not any(detected.values()):
-        detected = suggest_flowers_by_occasion(occasion, intent)
+    if not mentioned:
+        return suggest_flowers_by_occasion(occasion, intent, hits)
+    
+    detected = {"focal": [], "line": [], "filler": [], "texture": []}
+    for _, role, flower_name in mentioned:
+        detected[role].append(_FLOWER_ENTRY[role][flower_name])
     
     return detected
 
-def suggest_flowers_by_occasion(occasion: str, intent: str) -> Dict[str, List[Dict]]:
+def suggest_flowers_by_occasion(
+    occasion: str,
+    intent: str,
+    hits: Optional[FrozenSet[str]] = None
+) -> Dict[str, List[Dict]]:
     """Suggest flowers based on occasion and intent keywords."""
+    if hits is None:
+        hits = _scan_keywords(intent)
     suggestions = {"focal": [], "line": [], "filler": [], "texture": []}
     
     # Wedding suggestions
-    if "wedding" in occasion or "wedding" in intent or "bridal" in intent:
-        suggestions["focal"].append({
-            "name": "garden roses",
-            "role": "focal",
-            **FLOWERS_BY_ROLE["focal"]["roses"]
-        })
-        suggestions["focal"].append({
-            "name": "peonies",
-            "role": "focal",
-            **FLOWERS_BY_ROLE["focal"]["peonies"]
-        })
-        suggestions["filler"].append({
-            "name": "baby breath",
-            "role": "filler",
-            **FLOWERS_BY_ROLE["filler"]["baby_breath"]
-        })
+    if "wedding" in occasion or "wedding" in hits or "bridal" in hits:
+        suggestions["focal"].append(_GARDEN_ROSES_ENTRY)
+        suggestions["focal"].append(_FLOWER_ENTRY["focal"]["peonies"])
+        suggestions["filler"].append(_FLOWER_ENTRY["filler"]["baby_breath"])
     
     # Romantic
-    elif "romantic" in intent or "anniversary" in intent:
-        suggestions["focal"].append({
-            "name": "roses",
-            "role": "focal",
-            **FLOWERS_BY_ROLE["focal"]["roses"]
-        })
-        suggestions["texture"].append({
-            "name": "ranunculus",
-            "role": "texture",
-            **FLOWERS_BY_ROLE["texture"]["ranunculus"]
-        })
+    elif "romantic" in hits or "anniversary" in hits:
+        suggestions["focal"].append(_FLOWER_ENTRY["focal"]["roses"])
+        suggestions["texture"].append(_FLOWER_ENTRY["texture"]["ranunculus"])
     
     # Vibrant/celebration
-    elif "vibrant" in intent or "celebration" in intent or "birthday" in intent:
-        suggestions["focal"].append({
-            "name": "sunflowers",
-            "role": "focal",
-            **FLOWERS_BY_ROLE["focal"]["sunflowers"]
-        })
-        suggestions["focal"].append({
-            "name": "dahlias",
-            "role": "focal",
-            **FLOWERS_BY_ROLE["focal"]["dahlias"]
-        })
+    elif "vibrant" in hits or "celebration" in hits or "birthday" in hits:
+        suggestions["focal"].append(_FLOWER_ENTRY["focal"]["sunflowers"])
+        suggestions["focal"].append(_FLOWER_ENTRY["focal"]["dahlias"])
     
     # Elegant/formal
-    elif "elegant" in intent or "formal" in intent:
-        suggestions["focal"].append({
-            "name": "orchids",
-            "role": "focal",
-            **FLOWERS_BY_ROLE["focal"]["orchids"]
-        })
-        suggestions["focal"].append({
-            "name": "lilies",
-            "role": "focal",
-            **FLOWERS_BY_ROLE["focal"]["lilies"]
-        })
+    elif "elegant" in hits or "formal" in hits:
+        suggestions["focal"].append(_FLOWER_ENTRY["focal"]["orchids"])
+        suggestions["focal"].append(_FLOWER_ENTRY["focal"]["lilies"])
     
     # Default to roses and mixed
     else:
-        suggestions["focal"].append({
-            "name": "roses",
-            "role": "focal",
-            **FLOWERS_BY_ROLE["focal"]["roses"]
-        })
-        suggestions["filler"].append({
-            "name": "waxflower",
-            "role": "filler",
-            **FLOWERS_BY_ROLE["filler"]["waxflower"]
-        })
+        suggestions["focal"].append(_FLOWER_ENTRY["focal"]["roses"])
+        suggestions["filler"].append(_FLOWER_ENTRY["filler"]["waxflower"])
     
     return suggestions
 
-def detect_foliage(intent: str, style: Dict) -> List[Dict]:
+def detect_foliage(
+    intent: str,
+    style: Dict,
+    hits: Optional[FrozenSet[str]] = None
+) -> List[Dict]:
     """Detect or suggest foliage based on style."""
+    if hits is None:
+        hits = _scan_keywords(intent)
     foliage = []
     
     # Check for explicit mentions
-    for category, types in FOLIAGE_TYPES.items():
-        for foliage_name, foliage_data in types.items():
-            if foliage_name.replace("_", " ") in intent:
-                foliage.append({
-                    "name": foliage_name.replace("_", " "),
-                    "category": category,
-                    **foliage_data
-                })
+    for entries in _FOLIAGE_ENTRY.values():
+        for entry in entries.values():
+            if entry["name"] in hits:
+                foliage.append(entry)
     
     # Suggest based on style if none detected
     if not foliage:
         if style.get("category") == "contemporary" and style.get("type") == "minimalist":
-            foliage.append({
-                "name": "eucalyptus",
-                "category": "structural",
-                **FOLIAGE_TYPES["structural"]["eucalyptus"]
-            })
+            foliage.append(_FOLIAGE_ENTRY["structural"]["eucalyptus"])
         elif style.get("category") == "contemporary" and style.get("type") == "garden_style":
-            foliage.append({
-                "name": "eucalyptus",
-                "category": "structural",
-                **FOLIAGE_TYPES["structural"]["eucalyptus"]
-            })
-            foliage.append({
-                "name": "ivy",
-                "category": "accent",
-                **FOLIAGE_TYPES["accent"]["ivy"]
-            })
+            foliage.append(_FOLIAGE_ENTRY["structural"]["eucalyptus"])
+            foliage.append(_FOLIAGE_ENTRY["accent"]["ivy"])
         elif style.get("category") == "ikebana":
-            foliage.append({
-                "name": "aspidistra",
-                "category": "dramatic",
-                **FOLIAGE_TYPES["dramatic"]["aspidistra"]
-            })
+            foliage.append(_FOLIAGE_ENTRY["dramatic"]["aspidistra"])
         else:
-            foliage.append({
-                "name": "ruscus",
-                "category": "structural",
-                **FOLIAGE_TYPES["structural"]["ruscus"]
-            })
+            foliage.append(_FOLIAGE_ENTRY["structural"]["ruscus"])
     
     return foliage
 
-def detect_color_scheme(intent: str, color_preference: str, occasion: str) -> Dict[str, Any]:
-    """Detect or map color scheme."""
-    intent_lower = intent.lower()
-    
-    # Check for explicit palette mentions
-    for palette_name, palette_data in COLOR_PALETTES.items():
-        if palette_name in intent_lower:
-            return {"palette": palette_name, **palette_data}
-    
-    # Check for season mentions
-    if "spring" in intent_lower:
-        return {"palette": "spring", **COLOR_PALETTES["spring"]}
-    if "summer" in intent_lower:
-        return {"palette": "summer", **COLOR_PALETTES["summer"]}
-    if "autumn" in intent_lower or "fall" in intent_lower:
-        return {"palette": "autumn", **COLOR_PALETTES["autumn"]}
-    if "winter" in intent_lower:
-        return {"palette": "winter", **COLOR_PALETTES["winter"]}
-    
-    # Check for mood/style mentions
-    if "romantic" in intent_lower or "wedding" in intent_lower:
-        return {"palette": "romantic", **COLOR_PALETTES["romantic"]}
-    if "elegant" in intent_lower or "formal" in intent_lower:
-        return {"palette": "elegant", **COLOR_PALETTES["elegant"]}
-    if "vibrant" in intent_lower or "bold" in intent_lower:
-        return {"palette": "vibrant", **COLOR_PALETTES["vibrant"]}
+def detect_color_scheme(
+    intent_lower: str,
+    color_preference: str,
+    occasion: str,
+    hits: Optional[FrozenSet[str]] = None
+) -> Dict[str, Any]:
+    """Detect or map color scheme from an already-lowercased intent."""
+    if hits is None:
+        hits = _scan_keywords(intent_lower)
+    
+    # Highest-priority palette cue present in the intent
+    ranked = [_PALETTE_CUE_RANK[keyword] for keyword in hits if keyword in _PALETTE_CUE_RANK]
+    if ranked:
+        _, palette_name = min(ranked)
+        return _PALETTE_ENTRY[palette_name]
     
     # Use provided preference
-    if color_preference in COLOR_PALETTES:
-        return {"palette": color_preference, **COLOR_PALETTES[color_preference]}
+    if color_preference in _PALETTE_ENTRY:
+        return _PALETTE_ENTRY[color_preference]
     
     # Default to analogous (most harmonious)
-    return {"palette": "analogous", **COLOR_PALETTES["analogous"]}
+    return _PALETTE_ENTRY["analogous"]
 
 def map_structure(style: Dict, colors: Dict) -> Dict[str, Any]:
     """Map structural techniques based on style and colors."""
     structure = {}
     
     # Balance from style
-    balance_type = style.get("balance", "asymmetrical")
-    if balance_type == "symmetrical":
-        structure["balance"] = STRUCTURAL_TECHNIQUES["balance"]["symmetrical_radial"]
-    elif balance_type == "radial symmetrical":
-        structure["balance"] = STRUCTURAL_TECHNIQUES["balance"]["symmetrical_radial"]
-    else:
-        structure["balance"] = STRUCTURAL_TECHNIQUES["balance"]["asymmetrical"]
-    
-    # Movement from style category
-    if style.get("type") == "cascade":
-        structure["movement"] = STRUCTURAL_TECHNIQUES["movement"]["cascade_fall"]
-    elif style.get("type") == "vertical":
-        structure["movement"] = STRUCTURAL_TECHNIQUES["movement"]["vertical_lift"]
-    elif style.get("type") == "horizontal":
-        structure["movement"] = STRUCTURAL_TECHNIQUES["movement"]["horizontal_sweep"]
-    else:
-        structure["movement"] = STRUCTURAL_TECHNIQUES["movement"]["spiral_rotation"]
+    structure["balance"] = _BALANCE_BY_STYLE.get(style.get("balance"), _DEFAULT_BALANCE)
+    
+    style_type = style.get("type")
+    style_key = (style.get("category"), style_type)
+    
+    # Movement from style type
+    structure["movement"] = _MOVEMENT_BY_TYPE.get(style_type, _DEFAULT_MOVEMENT)
     
     # Proportion
-    structure["proportion"] = STRUCTURAL_TECHNIQUES["proportion"]["golden_ratio"]
+    structure["proportion"] = _PROPORTION
     
     # Focal points
-    if style.get("category") == "contemporary" and style.get("type") == "minimalist":
-        structure["focal"] = STRUCTURAL_TECHNIQUES["focal_points"]["single_dominant"]
-    else:
-        structure["focal"] = STRUCTURAL_TECHNIQUES["focal_points"]["multiple_secondary"]
+    structure["focal"] = _FOCAL_BY_STYLE.get(style_key, _DEFAULT_FOCAL)
     
     # Density
-    if style.get("category") == "contemporary" and style.get("type") == "minimalist":
-        structure["density"] = STRUCTURAL_TECHNIQUES["density"]["airy_spacious"]
-    elif style.get("category") == "contemporary" and style.get("type") == "garden_style":
-        structure["density"] = STRUCTURAL_TECHNIQUES["density"]["packed_abundant"]
-    else:
-        structure["density"] = STRUCTURAL_TECHNIQUES["density"]["clustered_with_voids"]
+    structure["density"] = _DENSITY_BY_STYLE.get(style_key, _DEFAULT_DENSITY)
     
     # Texture
-    structure["texture"] = STRUCTURAL_TECHNIQUES["texture"]["smooth_rough_contrast"]
+    structure["texture"] = _TEXTURE
     
     return structure
 
 def map_occasion(occasion: str, style: Dict) -> Dict[str, Any]:
     """Map occasion-specific requirements."""
-    if occasion in OCCASIONS:
-        return OCCASIONS[occasion]
+    if occasion in taxonomy.OCCASIONS:
+        return taxonomy.OCCASIONS[occasion]
     
     # Check for occasion keywords in various categories
-    for occ_name, occ_data in OCCASIONS.items():
-        if occasion in str(occ_data).lower():
-            return {occ_name: occ_data}
+    occ_name = _OCCASION_INDEX.get(occasion) or _first_occasion_containing(occasion)
+    if occ_name is not None:
+        return _OCCASION_MATCH[occ_name]
     
-    return {"occasion": "general", "notes": "versatile arrangement suitable for various contexts"}
+    return _GENERAL_OCCASION
 
 def get_cultural_context(style: Dict) -> Dict[str, Any]:
     """Get cultural context for the style."""
     if style.get("category") == "ikebana":
-        return CULTURAL_TRADITIONS["japanese_ikebana"]
+        return taxonomy.CULTURAL_TRADITIONS["japanese_ikebana"]
     elif style.get("category") == "contemporary" and style.get("type") == "garden_style":
-        return CULTURAL_TRADITIONS["european_garden"]
+        return taxonomy.CULTURAL_TRADITIONS["european_garden"]
     elif style.get("category") == "contemporary":
-        return CULTURAL_TRADITIONS["contemporary_western"]
+        return taxonomy.CULTURAL_TRADITIONS["contemporary_western"]
     else:
-        return CULTURAL_TRADITIONS["european_garden"]
+        return taxonomy.CULTURAL_TRADITIONS["european_garden"]
 
-def format_prompt_enhancement(mapped: Dict[str, Any]) -> str:
-    """Format the mapped taxonomy into an enhanced prompt string."""
+@lru_cache(maxsize=1024)
+def _enhanced_prompt(
+    user_intent: str,
+    style_preference: str = "any",
+    occasion: str = "general",
+    color_scheme: str = "harmonious"
+) -> str:
+    """Memoized format_prompt_enhancement() of the mapping for these arguments."""
+    return format_prompt_enhancement(
+        map_floral_taxonomy(user_intent, style_preference, occasion, color_scheme)
+    )
+
+def _iter_prompt_parts(mapped: Dict[str, Any]):
+    """Yield the comma-separated components of the enhanced prompt in order."""
     style = mapped["style"]
     flowers = mapped["flowers"]
-    foliage = mapped["foliage"]
     colors = mapped["colors"]
     structure = mapped["structure"]
     
-    # Build prompt components
-    parts = []
-    
     # Style and container
-    parts.append(f"{style['type'].replace('_', ' ').title()} floral arrangement")
-    parts.append(f"in {style['container']}")
+    yield style["type"].replace("_", " ").title() + " floral arrangement"
+    yield "in " + style["container"]
     
     # Flowers by role
-    focal_flowers = [f["name"] for f in flowers.get("focal", [])]
+    focal_flowers = flowers.get("focal")
     if focal_flowers:
-        parts.append(f"featuring {', '.join(focal_flowers)} as focal flowers")
+        yield "featuring " + ", ".join([f["name"] for f in focal_flowers]) + " as focal flowers"
     
-    line_flowers = [f["name"] for f in flowers.get("line", [])]
+    line_flowers = flowers.get("line")
     if line_flowers:
-        parts.append(f"with {', '.join(line_flowers)} creating vertical lines")
+        yield "with " + ", ".join([f["name"] for f in line_flowers]) + " creating vertical lines"
     
-    filler_flowers = [f["name"] for f in flowers.get("filler", [])]
+    filler_flowers = flowers.get("filler")
     if filler_flowers:
-        parts.append(f"filled with {', '.join(filler_flowers)}")
+        yield "filled with " + ", ".join([f["name"] for f in filler_flowers])
     
     # Foliage
-    foliage_names = [f["name"] for f in foliage]
-    if foliage_names:
-        parts.append(f"accented with {', '.join(foliage_names)} foliage")
+    foliage = mapped["foliage"]
+    if foliage:
+        yield "accented with " + ", ".join([f["name"] for f in foliage]) + " foliage"
     
     # Colors
     if "colors" in colors:
-        parts.append(f"in {', '.join(colors['colors'])} palette")
+        yield "in " + ", ".join(colors["colors"]) + " palette"
     
     # Structure
-    parts.append(f"using {structure['balance']['description']}")
-    parts.append(f"with {structure['movement']['description']}")
+    yield "using " + structure["balance"]["description"]
+    yield "with " + structure["movement"]["description"]
     
     # Effects
-    parts.append(f"creating {style.get('characteristics', 'beautiful composition')}")
-    
-    return ", ".join(parts)
+    yield f"creating {style.get('characteristics', 'beautiful composition')}"
+
+def format_prompt_enhancement(mapped: Dict[str, Any]) -> str:
+    """Format the mapped taxonomy into an enhanced prompt string."""
+    return ", ".join(_iter_prompt_parts(mapped))
 
 # ============================================================================
 # COMFYUI WORKFLOW GENERATION
 # ============================================================================
 
+_MODEL_MAP = {
+    "flux": "flux1-dev.safetensors",
+    "sdxl": "sd_xl_base_1.0.safetensors",
+    "sd15": "v1-5-pruned-emaonly.safetensors"
+}
+
+_NEGATIVE_PROMPT: Final[str] = (
+    "wilted, dead, brown, artificial, plastic, fake flowers, "
+    "low quality, blurry, distorted, malformed flowers, "
+    "ugly arrangement, chaotic, messy, cluttered"
+)
+
+# Pre-parsed (width, height) for the documented output sizes
+_SIZE_TABLE = {
+    size: tuple(map(int, size.split("x")))
+    for size in ("1024x1024", "1024x768", "768x1024", "1536x1024", "1024x1536")
+}
+
 def get_model_file(model_preference: str) -> str:
     """Map model preference to checkpoint filename."""
-    model_map = {
-        "flux": "flux1-dev.safetensors",
-        "sdxl": "sd_xl_base_1.0.safetensors",
-        "sd15": "v1-5-pruned-emaonly.safetensors"
-    }
-    return model_map.get(model_preference, model_map["flux"])
+    return _MODEL_MAP.get(model_preference, _MODEL_MAP["flux"])
 
 def build_comfyui_workflow(
     prompt: str,
@@ -1003,13 +581,13 @@ def build_comfyui_workflow(
     steps: int
 ) -> Dict[str, Any]:
     """Build complete ComfyUI workflow JSON."""
-    width, height = map(int, size.split('x'))
+    width, height = _SIZE_TABLE.get(size) or map(int, size.split('x'))
     
     workflow = {
         "1": {
             "class_type": "CheckpointLoaderSimple",
             "inputs": {
-                "ckpt_name": get_model_file(model)
+                "ckpt_name": _MODEL_MAP.get(model, _MODEL_MAP["flux"])
             }
         },
         "2": {
@@ -1067,6 +645,11 @@ def build_comfyui_workflow(
     
     return workflow
 
+@lru_cache(maxsize=256)
+def _workflow_json(prompt: str, negative_prompt: str, size: str, model: str, steps: int) -> str:
+    """Memoized JSON text of the workflow, formatted for pasting into ComfyUI."""
+    return json.dumps(build_comfyui_workflow(prompt, negative_prompt, size, model, steps), indent=2)
+
 # ============================================================================
 # MCP TOOL DEFINITIONS
 # ============================================================================
@@ -1118,7 +701,7 @@ def enhance_floral_prompt(
     mapped = map_floral_taxonomy(user_intent, style_preference, occasion, color_scheme)
     
     # Format basic prompt
-    enhanced_prompt = format_prompt_enhancement(mapped)
+    enhanced_prompt = _enhanced_prompt(user_intent, style_preference, occasion, color_scheme)
     
     # Return structured data for Claude synthesis
     return {
@@ -1145,7 +728,8 @@ def generate_floral_workflow(
     user_intent: str,
     output_size: str = "1024x1024",
     model_preference: str = "flux",
-    steps: int = 20
+    steps: int = 20,
+    include_workflow_json: bool = False
 ) -> dict:
     """
     Generate ComfyUI workflow JSON for floral arrangement imagery.
@@ -1167,10 +751,13 @@ def generate_floral_workflow(
             - "sdxl" (Stable Diffusion XL)
             - "sd15" (Stable Diffusion 1.5)
         steps: Number of sampling steps (10-50, default 20)
+        include_workflow_json: Also return the workflow as JSON text (default False)
     
     Returns:
         Dictionary with:
         - workflow: Complete ComfyUI workflow JSON ready to import
+        - workflow_json: The same workflow serialized as JSON text
+          (only when include_workflow_json is set)
         - positive_prompt: Enhanced prompt used
         - negative_prompt: Negative prompt to avoid unwanted elements
         - metadata: Information about flowers, style, colors used
@@ -1187,29 +774,23 @@ def generate_floral_workflow(
     mapped = map_floral_taxonomy(user_intent)
     
     # Build enhanced prompt
-    positive_prompt = format_prompt_enhancement(mapped)
-    
-    # Build negative prompt
-    negative_prompt = (
-        "wilted, dead, brown, artificial, plastic, fake flowers, "
-        "low quality, blurry, distorted, malformed flowers, "
-        "ugly arrangement, chaotic, messy, cluttered"
-    )
+    positive_prompt = _enhanced_prompt(user_intent)
     
     # Build ComfyUI workflow
     workflow = build_comfyui_workflow(
         prompt=positive_prompt,
-        negative_prompt=negative_prompt,
+        negative_prompt=_NEGATIVE_PROMPT,
         size=output_size,
         model=model_preference,
         steps=steps
     )
     
     # Compile metadata
-    focal_names = [f["name"] for f in mapped["flowers"].get("focal", [])]
-    all_flowers = []
-    for role in ["focal", "line", "filler", "texture"]:
-        all_flowers.extend([f["name"] for f in mapped["flowers"].get(role, [])])
+    flowers = mapped["flowers"]
+    focal_names = [f["name"] for f in flowers.get("focal", ())]
+    all_flowers = [
+        f["name"] for role in _ROLES for f in flowers.get(role, ())
+    ]
     
     foliage_names = [f["name"] for f in mapped["foliage"]]
     
@@ -1223,10 +804,10 @@ def generate_floral_workflow(
         "cultural_tradition": mapped["cultural_context"].get("philosophy", "")
     }
     
-    return {
+    result = {
         "workflow": workflow,
         "positive_prompt": positive_prompt,
-        "negative_prompt": negative_prompt,
+        "negative_prompt": _NEGATIVE_PROMPT,
         "metadata": metadata,
         "usage_instructions": (
             "1. Copy the 'workflow' JSON from this response\n"
@@ -1236,6 +817,14 @@ def generate_floral_workflow(
             "5. Adjust seed value in node 5 for variations"
         )
     }
+    
+    # Serialized text is cached per distinct workflow; opt-in since it doubles the payload
+    if include_workflow_json:
+        result["workflow_json"] = _workflow_json(
+            positive_prompt, _NEGATIVE_PROMPT, output_size, model_preference, steps
+        )
+    
+    return result
 
 @mcp.tool()
 def list_arrangement_styles() -> dict:
@@ -1253,7 +842,7 @@ def list_arrangement_styles() -> dict:
     Returns:
         Dictionary organized by tradition with complete style specifications
     """
-    return ARRANGEMENT_STYLES
+    return taxonomy.ARRANGEMENT_STYLES
 
 @mcp.tool()
 def list_flowers_by_role() -> dict:
@@ -1271,7 +860,7 @@ def list_flowers_by_role() -> dict:
     Returns:
         Dictionary organized by role with complete flower specifications
     """
-    return FLOWERS_BY_ROLE
+    return taxonomy.FLOWERS_BY_ROLE
 
 @mcp.tool()
 def list_color_palettes() -> dict:
@@ -1288,7 +877,7 @@ def list_color_palettes() -> dict:
     Returns:
         Dictionary of all color palette specifications
     """
-    return COLOR_PALETTES
+    return taxonomy.COLOR_PALETTES
 
 @mcp.tool()
 def list_foliage_types() -> dict:
@@ -1305,7 +894,7 @@ def list_foliage_types() -> dict:
     Returns:
         Dictionary of foliage specifications by category
     """
-    return FOLIAGE_TYPES
+    return taxonomy.FOLIAGE_TYPES
 
 @mcp.tool()
 def get_cultural_traditions() -> dict:
@@ -1323,7 +912,7 @@ def get_cultural_traditions() -> dict:
     Returns:
         Dictionary of cultural traditions with philosophies and principles
     """
-    return CULTURAL_TRADITIONS
+    return taxonomy.CULTURAL_TRADITIONS
 
 @mcp.tool()
 def get_structural_techniques() -> dict:
@@ -1343,7 +932,7 @@ def get_structural_techniques() -> dict:
     Returns:
         Dictionary of all structural technique specifications
     """
-    return STRUCTURAL_TECHNIQUES
+    return taxonomy.STRUCTURAL_TECHNIQUES
 
 @mcp.tool()
 def suggest_flowers_for_occasion(occasion: str) -> dict:
@@ -1364,56 +953,96 @@ def suggest_flowers_for_occasion(occasion: str) -> dict:
     Returns:
         Dictionary with occasion-specific recommendations
     """
-    if occasion in OCCASIONS:
+    if occasion in taxonomy.OCCASIONS:
         return {
             "occasion": occasion,
-            "recommendations": OCCASIONS[occasion]
+            "recommendations": taxonomy.OCCASIONS[occasion]
         }
     else:
         return {
             "occasion": occasion,
             "error": f"Occasion '{occasion}' not found",
-            "available_occasions": list(OCCASIONS.keys())
+            "available_occasions": list(taxonomy.OCCASIONS.keys())
         }
 
 # ============================================================================
 # SERVER INFO
 # ============================================================================
 
+# Records for the get_server_info payload. Their docstrings end up in the
+# tool's client-visible output schema, so they describe the data for clients;
+# field order is the order fields are serialized in.
+@dataclass(frozen=True, slots=True)
+class Architecture:
+    """The server's three processing layers."""
+    layer_1: str
+    layer_2: str
+    layer_3: str
+
+@dataclass(frozen=True, slots=True)
+class PrimaryTools:
+    """The main tools and what each one does."""
+    enhance_floral_prompt: str
+    generate_floral_workflow: str
+
+@dataclass(frozen=True, slots=True)
+class TaxonomyCoverage:
+    """What the floral taxonomy covers."""
+    arrangement_styles: str
+    flowers: str
+    foliage: str
+    color_palettes: str
+    structural_techniques: str
+    cultural_traditions: str
+
+@dataclass(frozen=True, slots=True)
+class ServerInfo:
+    """Overview of the Floral Arrangement Aesthetics MCP server."""
+    name: str
+    version: str
+    description: str
+    architecture: Architecture
+    primary_tools: PrimaryTools
+    taxonomy_coverage: TaxonomyCoverage
+    cost_optimization: str
+    usage_pattern: str
+
+_SERVER_INFO = ServerInfo(
+    name="Floral Arrangement Aesthetics MCP Server",
+    version="1.0.0",
+    description="Dual-purpose server for floral arrangement prompt enhancement and ComfyUI workflow generation",
+    architecture=Architecture(
+        layer_1="Comprehensive floral taxonomy (deterministic, zero LLM cost)",
+        layer_2="Structural mapping and technique selection",
+        layer_3="Cultural and aesthetic context synthesis (Claude integration)"
+    ),
+    primary_tools=PrimaryTools(
+        enhance_floral_prompt="Map user intent to professional floral vocabulary for prompt enhancement",
+        generate_floral_workflow="Create complete ComfyUI workflow JSON with floral-enhanced prompts"
+    ),
+    taxonomy_coverage=TaxonomyCoverage(
+        arrangement_styles="15 styles across 3 traditions (Ikebana, Western Classical, Contemporary)",
+        flowers="20+ flowers organized by role (focal, line, filler, texture)",
+        foliage="10+ foliage types across 3 categories (structural, accent, dramatic)",
+        color_palettes="10 palettes including theory-based and seasonal",
+        structural_techniques="6 technique categories with detailed specifications",
+        cultural_traditions="4 major traditions with philosophies and principles"
+    ),
+    cost_optimization="60-80% cost savings through deterministic taxonomy mapping + single LLM synthesis",
+    usage_pattern="User → Claude (intent extraction) → MCP (deterministic mapping) → Claude (creative synthesis)"
+)
+
 @mcp.tool()
-def get_server_info() -> dict:
+def get_server_info() -> ServerInfo:
     """
     Get information about the Floral Arrangement Aesthetics MCP server.
     
     Returns overview of capabilities, architecture, and usage patterns.
     
     Returns:
-        Dictionary with server information and capabilities
+        ServerInfo record with server information and capabilities
     """
-    return {
-        "name": "Floral Arrangement Aesthetics MCP Server",
-        "version": "1.0.0",
-        "description": "Dual-purpose server for floral arrangement prompt enhancement and ComfyUI workflow generation",
-        "architecture": {
-            "layer_1": "Comprehensive floral taxonomy (deterministic, zero LLM cost)",
-            "layer_2": "Structural mapping and technique selection",
-            "layer_3": "Cultural and aesthetic context synthesis (Claude integration)"
-        },
-        "primary_tools": {
-            "enhance_floral_prompt": "Map user intent to professional floral vocabulary for prompt enhancement",
-            "generate_floral_workflow": "Create complete ComfyUI workflow JSON with floral-enhanced prompts"
-        },
-        "taxonomy_coverage": {
-            "arrangement_styles": "15 styles across 3 traditions (Ikebana, Western Classical, Contemporary)",
-            "flowers": "20+ flowers organized by role (focal, line, filler, texture)",
-            "foliage": "10+ foliage types across 3 categories (structural, accent, dramatic)",
-            "color_palettes": "10 palettes including theory-based and seasonal",
-            "structural_techniques": "6 technique categories with detailed specifications",
-            "cultural_traditions": "4 major traditions with philosophies and principles"
-        },
-        "cost_optimization": "60-80% cost savings through deterministic taxonomy mapping + single LLM synthesis",
-        "usage_pattern": "User → Claude (intent extraction) → MCP (deterministic mapping) → Claude (creative synthesis)"
-    }
+    return _SERVER_INFO
 
 # ============================================================================
 # SERVER ENTRY POINT
@@ -1421,8 +1050,16 @@ def get_server_info() -> dict:
 
 def main():
     """Entry point for running the MCP server."""
-    import asyncio
-    mcp.run()
+    # Prefer uvloop (winloop on Windows) when the "speedups" extra is installed.
+    # It is handed to anyio as a loop factory rather than installed as a global
+    # event loop policy, which asyncio deprecates.
+    loop_module = "winloop" if sys.platform == "win32" else "uvloop"
+    try:
+        fast_loop = importlib.import_module(loop_module)
+    except ImportError:
+        mcp.run()
+    else:
+        anyio.run(mcp.run_async, backend_options={"loop_factory": fast_loop.new_event_loop})
 
 if __name__ == "__main__":
     main()
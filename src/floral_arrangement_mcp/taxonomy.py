@@ -0,0 +1,531 @@
+"""
+Layer 1 floral taxonomy.
+
+The deterministic taxonomy tables (arrangement styles, flowers, foliage,
+palettes, techniques, occasions, traditions) ship as one packaged JSON file
+per table. Each table is parsed on its own first attribute access, via a
+module-level __getattr__, so a request that only needs one table never parses
+the others. After the first parse a table is also dumped to a marshal sidecar
+in the user cache directory, which later interpreter starts load instead.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from enum import IntEnum
+from importlib.resources import files
+from itertools import compress
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+TABLES = (
+    "ARRANGEMENT_STYLES",
+    "FLOWERS_BY_ROLE",
+    "FOLIAGE_TYPES",
+    "COLOR_PALETTES",
+    "STRUCTURAL_TECHNIQUES",
+    "OCCASIONS",
+    "CULTURAL_TRADITIONS",
+)
+
+# Listing the tables lets `from .taxonomy import *` resolve them via __getattr__
+__all__ = [
+    *TABLES,
+    "Balance",
+    "Complexity",
+    "Flower",
+    "Foliage",
+    "FrozenDict",
+    "flower_records",
+    "flowers_for_season",
+    "flowers_for_symbolism",
+    "flowers_with_tags",
+    "foliage_records",
+    "foliage_with_tags",
+    "load_table",
+    "load_taxonomy",
+    "lookup",
+    "palettes_for_occasion",
+    "query_styles",
+    "styles_for_balance",
+]
+
+# Loaded tables by name, filled in by load_table()
+_LOADED: Dict[str, Any] = {}
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict for the shared taxonomy tables.
+
+    Tables are handed out by reference, so consumers can keep or return them
+    without a defensive copy. Still a real dict, so json and the MCP response
+    serializer accept it; use dict(table) when a mutable copy is needed.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The default dict-subclass protocol would rebuild via __setitem__
+        return (type(self), (dict(self),))
+
+
+def _cache_path(stem: str, source: Path) -> Path:
+    """
+    Marshal sidecar location for one JSON source.
+
+    The name carries a digest of the source path, so separate installs (two
+    venvs, say) never share a sidecar, and the Python version, since marshal
+    output is specific to it.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    digest = hashlib.sha256(os.fsencode(source)).hexdigest()[:16]
+    version = f"{sys.version_info.major}{sys.version_info.minor}"
+    return Path(base) / "floral_mcp" / f"{stem}.{digest}.{version}.marshal"
+
+
+def _source_key(source: Path) -> Tuple[str, int, int]:
+    """Identity of a JSON source as stored in its sidecar: path, mtime and size."""
+    stat = source.stat()
+    return (str(source), stat.st_mtime_ns, stat.st_size)
+
+
+def _read_cached(cache: Path, key: Tuple[str, int, int]) -> Optional[Dict[str, Any]]:
+    """Return the sidecar contents if it was written from exactly this source."""
+    try:
+        with cache.open("rb") as fh:
+            stored_key, data = marshal.load(fh)
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if stored_key != key or not isinstance(data, dict):
+        return None
+    return data
+
+
+def _write_cached(cache: Path, key: Tuple[str, int, int], data: Dict[str, Any]) -> None:
+    """Best-effort sidecar write; an unwritable cache dir just means no cache."""
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as fh:
+            marshal.dump((key, data), fh)
+        os.replace(tmp, cache)
+    except (OSError, ValueError):
+        pass
+
+
+def _read_table(stem: str) -> Dict[str, Any]:
+    source = files(__package__) / "data" / f"{stem}.json"
+    if not isinstance(source, Path):
+        # Not on a real filesystem (e.g. zipimport): nothing to key the cache on
+        return json.loads(source.read_bytes())
+
+    source = source.resolve()
+    cache = _cache_path(stem, source)
+    key = _source_key(source)
+    data = _read_cached(cache, key)
+    if data is None:
+        data = json.loads(source.read_bytes())
+        _write_cached(cache, key, data)
+    return data
+
+
+def _intern_tree(node: Any) -> Any:
+    """Intern every key and string leaf so repeated values share one object."""
+    if isinstance(node, dict):
+        return {sys.intern(k): _intern_tree(v) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_intern_tree(item) for item in node]
+    if isinstance(node, str):
+        return sys.intern(node)
+    return node
+
+
+def _dedupe_tree(node: Any, seen: Dict[Any, Any]) -> Tuple[Any, Any]:
+    """
+    Hash-cons equal containers so duplicate subtrees share one object.
+
+    Returns the shared node and its canonical (hashable) form. Key order is
+    part of the canonical form, so shared dicts serialize identically.
+    """
+    if isinstance(node, dict):
+        children = {k: _dedupe_tree(v, seen) for k, v in node.items()}
+        key = (dict, tuple((k, canon) for k, (_, canon) in children.items()))
+        if key not in seen:
+            seen[key] = {k: child for k, (child, _) in children.items()}
+    elif isinstance(node, list):
+        children = [_dedupe_tree(item, seen) for item in node]
+        key = (list, tuple(canon for _, canon in children))
+        if key not in seen:
+            seen[key] = [child for child, _ in children]
+    else:
+        # Scalars are shared already; tag with the type so 1 and True differ
+        return node, (type(node), node)
+    return seen[key], key
+
+
+def _freeze(node: Any, memo: Dict[int, Any]) -> Any:
+    """Convert dicts to FrozenDict and lists to tuples, keeping shared subtrees shared."""
+    if not isinstance(node, (dict, list)):
+        return node
+    frozen = memo.get(id(node))
+    if frozen is None:
+        if isinstance(node, dict):
+            frozen = FrozenDict({k: _freeze(v, memo) for k, v in node.items()})
+        else:
+            frozen = tuple(_freeze(item, memo) for item in node)
+        memo[id(node)] = frozen
+    return frozen
+
+
+def load_table(name: str) -> Any:
+    """Load one table (e.g. "FLOWERS_BY_ROLE") on first call and return it read-only."""
+    table = _LOADED.get(name)
+    if table is None:
+        if name not in TABLES:
+            raise KeyError(name)
+        shared, _ = _dedupe_tree(_intern_tree(_read_table(name.lower())), {})
+        table = _LOADED[name] = _freeze(shared, {})
+    return table
+
+
+def load_taxonomy() -> Dict[str, Any]:
+    """Load every table and return them keyed by name."""
+    return FrozenDict({name: load_table(name) for name in TABLES})
+
+
+# ============================================================================
+# COLUMN VIEW FOR STYLE QUERIES
+# ============================================================================
+
+class Balance(IntEnum):
+    """Balance type of an arrangement style."""
+    SYMMETRICAL = 0
+    ASYMMETRICAL = 1
+    RADIAL = 2
+    MIXED = 3
+
+
+class Complexity(IntEnum):
+    """Ordinal complexity, so "at least medium" is one integer comparison."""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    VERY_HIGH = 3
+
+
+# Labels as they appear in the taxonomy data; the tables themselves keep the
+# strings so tool responses stay human-readable.
+_BALANCE_LABELS = {
+    "symmetrical": Balance.SYMMETRICAL,
+    "asymmetrical": Balance.ASYMMETRICAL,
+    "radial symmetrical": Balance.RADIAL,
+    "symmetrical or asymmetrical": Balance.MIXED,
+    "often asymmetrical": Balance.MIXED,
+}
+
+_COMPLEXITY_LABELS = {
+    "low": Complexity.LOW,
+    "medium": Complexity.MEDIUM,
+    "high": Complexity.HIGH,
+    "very high": Complexity.VERY_HIGH,
+}
+
+
+class _StyleColumns(NamedTuple):
+    family: Tuple[str, ...]
+    name: Tuple[str, ...]
+    balance: Tuple[Balance, ...]
+    complexity: Tuple[Complexity, ...]
+
+
+_STYLE_COLUMNS: Optional[_StyleColumns] = None
+
+
+def _style_columns() -> _StyleColumns:
+    """Flatten ARRANGEMENT_STYLES into parallel columns of enum codes."""
+    global _STYLE_COLUMNS
+    if _STYLE_COLUMNS is None:
+        family, name, balance, complexity = [], [], [], []
+        for style_family, styles in load_table("ARRANGEMENT_STYLES").items():
+            for style_name, attrs in styles.items():
+                family.append(style_family)
+                name.append(style_name)
+                balance.append(_BALANCE_LABELS[attrs["balance"]])
+                complexity.append(_COMPLEXITY_LABELS[attrs["complexity"]])
+        _STYLE_COLUMNS = _StyleColumns(
+            tuple(family), tuple(name), tuple(balance), tuple(complexity)
+        )
+    return _STYLE_COLUMNS
+
+
+def _coerce(value: Union[str, IntEnum], enum_cls: type, labels: Dict[str, Any]) -> Any:
+    """Map a taxonomy label or a member of enum_cls to its enum member."""
+    if isinstance(value, enum_cls):
+        return value
+    if isinstance(value, IntEnum):
+        raise TypeError(f"Expected {enum_cls.__name__} or a label, got {value!r}")
+    if value not in labels:
+        raise ValueError(f"Unknown label {value!r}, expected one of {tuple(labels)}")
+    return labels[value]
+
+
+def query_styles(
+    balance: Optional[Union[str, Balance]] = None,
+    min_complexity: Optional[Union[str, Complexity]] = None
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Find arrangement styles by balance and/or minimum complexity.
+
+    Accepts enum members or the taxonomy's labels and returns (family, style)
+    pairs in taxonomy order, e.g.
+    query_styles(balance=Balance.ASYMMETRICAL, min_complexity="high").
+    """
+    columns = _style_columns()
+    mask = [True] * len(columns.name)
+    if balance is not None:
+        code = _coerce(balance, Balance, _BALANCE_LABELS)
+        mask = [m and c == code for m, c in zip(mask, columns.balance)]
+    if min_complexity is not None:
+        floor = _coerce(min_complexity, Complexity, _COMPLEXITY_LABELS)
+        mask = [m and c >= floor for m, c in zip(mask, columns.complexity)]
+    return tuple(compress(zip(columns.family, columns.name), mask))
+
+
+# ============================================================================
+# RECORD VIEWS
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class Flower:
+    """
+    Slotted record for one FLOWERS_BY_ROLE entry.
+
+    name is the taxonomy key (e.g. "baby_breath"). Fields a role does not use
+    (line flowers have height but no seasons, for example) are left empty.
+    """
+    name: str
+    role: str
+    characteristics: str
+    types: Tuple[str, ...] = ()
+    color_range: str = ""
+    size: str = ""
+    height: str = ""
+    seasons: Tuple[str, ...] = ()
+    symbolism: str = ""
+    use: str = ""
+    texture: str = ""
+    tags: FrozenSet[int] = frozenset()
+
+
+@dataclass(frozen=True, slots=True)
+class Foliage:
+    """Slotted record for one FOLIAGE_TYPES entry."""
+    name: str
+    category: str
+    characteristics: str
+    use: str
+    types: Tuple[str, ...] = ()
+    tags: FrozenSet[int] = frozenset()
+
+
+_FLOWER_RECORDS: Optional[FrozenDict] = None
+_FOLIAGE_RECORDS: Optional[FrozenDict] = None
+
+# Shared vocabulary: each characteristics word gets a small integer id, so
+# record.tags is a frozenset of ints and multi-tag filters are set operations.
+_TAG_VOCAB: Dict[str, int] = {}
+_TAG_TOKEN_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
+
+def _tag(text: str) -> FrozenSet[int]:
+    return frozenset(
+        _TAG_VOCAB.setdefault(sys.intern(token), len(_TAG_VOCAB))
+        for token in _TAG_TOKEN_RE.findall(text.lower())
+    )
+
+
+def _record_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {**data, "tags": _tag(data["characteristics"])}
+
+
+def flower_records() -> FrozenDict:
+    """FLOWERS_BY_ROLE as role -> name -> Flower, built on first use."""
+    global _FLOWER_RECORDS
+    if _FLOWER_RECORDS is None:
+        _FLOWER_RECORDS = FrozenDict({
+            role: FrozenDict({
+                name: Flower(name=name, role=role, **_record_fields(data))
+                for name, data in flowers.items()
+            })
+            for role, flowers in load_table("FLOWERS_BY_ROLE").items()
+        })
+    return _FLOWER_RECORDS
+
+
+def foliage_records() -> FrozenDict:
+    """FOLIAGE_TYPES as category -> name -> Foliage, built on first use."""
+    global _FOLIAGE_RECORDS
+    if _FOLIAGE_RECORDS is None:
+        _FOLIAGE_RECORDS = FrozenDict({
+            category: FrozenDict({
+                name: Foliage(name=name, category=category, **_record_fields(data))
+                for name, data in types.items()
+            })
+            for category, types in load_table("FOLIAGE_TYPES").items()
+        })
+    return _FOLIAGE_RECORDS
+
+
+def _tag_ids(words: Tuple[str, ...]) -> Optional[FrozenSet[int]]:
+    """Vocabulary ids for words, or None if any word never appears as a tag."""
+    ids = [_TAG_VOCAB.get(word.lower()) for word in words]
+    return None if None in ids else frozenset(ids)
+
+
+def flowers_with_tags(*words: str) -> Tuple[Flower, ...]:
+    """Flowers whose characteristics mention every given word, e.g. "tropical"."""
+    records = flower_records()
+    wanted = _tag_ids(words)
+    if wanted is None:
+        return ()
+    return tuple(
+        flower for flowers in records.values() for flower in flowers.values()
+        if flower.tags >= wanted
+    )
+
+
+def foliage_with_tags(*words: str) -> Tuple[Foliage, ...]:
+    """Foliage whose characteristics mention every given word."""
+    records = foliage_records()
+    wanted = _tag_ids(words)
+    if wanted is None:
+        return ()
+    return tuple(
+        foliage for types in records.values() for foliage in types.values()
+        if foliage.tags >= wanted
+    )
+
+
+# ============================================================================
+# INVERTED INDICES
+# ============================================================================
+
+class _Indexes(NamedTuple):
+    by_season: Mapping[str, Tuple[Tuple[str, str], ...]]
+    by_occasion: Mapping[str, Tuple[str, ...]]
+    by_balance: Mapping[str, Tuple[Tuple[str, str], ...]]
+    by_symbolism: Mapping[str, Tuple[Tuple[str, str], ...]]
+
+
+_INDEXES: Optional[_Indexes] = None
+
+
+def _freeze_index(index: Dict[str, List[Any]]) -> Mapping[str, Tuple[Any, ...]]:
+    return MappingProxyType({key: tuple(values) for key, values in index.items()})
+
+
+def _indexes() -> _Indexes:
+    """Build the reverse lookups in a single pass over the loaded tables."""
+    global _INDEXES
+    if _INDEXES is None:
+        by_season = defaultdict(list)
+        by_symbolism = defaultdict(list)
+        for flowers in flower_records().values():
+            for flower in flowers.values():
+                for season in flower.seasons:
+                    by_season[season].append((flower.role, flower.name))
+                for term in flower.symbolism.split(","):
+                    if term.strip():
+                        by_symbolism[term.strip()].append((flower.role, flower.name))
+
+        by_occasion = defaultdict(list)
+        for palette, data in load_table("COLOR_PALETTES").items():
+            for occasion in data.get("occasions", ()):
+                by_occasion[occasion].append(palette)
+
+        by_balance = defaultdict(list)
+        for family, styles in load_table("ARRANGEMENT_STYLES").items():
+            for name, attrs in styles.items():
+                by_balance[attrs["balance"]].append((family, name))
+
+        _INDEXES = _Indexes(
+            _freeze_index(by_season),
+            _freeze_index(by_occasion),
+            _freeze_index(by_balance),
+            _freeze_index(by_symbolism),
+        )
+    return _INDEXES
+
+
+def flowers_for_season(season: str) -> Tuple[Tuple[str, str], ...]:
+    """(role, flower) pairs in bloom for a season, e.g. "summer" or "late spring"."""
+    return _indexes().by_season.get(season, ())
+
+
+def flowers_for_symbolism(meaning: str) -> Tuple[Tuple[str, str], ...]:
+    """(role, flower) pairs whose symbolism includes a term such as "romance"."""
+    return _indexes().by_symbolism.get(meaning, ())
+
+
+def palettes_for_occasion(occasion: str) -> Tuple[str, ...]:
+    """Color palette names listed as suitable for an occasion."""
+    return _indexes().by_occasion.get(occasion, ())
+
+
+def styles_for_balance(balance: str) -> Tuple[Tuple[str, str], ...]:
+    """(family, style) pairs with the given balance label."""
+    return _indexes().by_balance.get(balance, ())
+
+
+# ============================================================================
+# FLAT PATH LOOKUP
+# ============================================================================
+
+_FLAT: Optional[Dict[Tuple[str, ...], Any]] = None
+
+
+def _flatten(node: Any, path: Tuple[str, ...], out: Dict[Tuple[str, ...], Any]) -> None:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            _flatten(value, path + (key,), out)
+    else:
+        out[path] = node
+
+
+def lookup(*path: str) -> Any:
+    """
+    Fetch a leaf value with one hash probe instead of one per nesting level.
+
+    The first path element is the lowercased table name, e.g.
+    lookup("arrangement_styles", "ikebana", "moribana", "balance").
+    Raises KeyError if the path does not name a leaf.
+    """
+    global _FLAT
+    if _FLAT is None:
+        flat: Dict[Tuple[str, ...], Any] = {}
+        for table, data in load_taxonomy().items():
+            _flatten(data, (table.lower(),), flat)
+        _FLAT = flat
+    return _FLAT[path]
+
+
+def __getattr__(name: str) -> Any:
+    if name in TABLES:
+        table = load_table(name)
+        # Cache as a real module attribute so later access skips this hook
+        globals()[name] = table
+        return table
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
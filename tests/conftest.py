@@ -0,0 +1,13 @@
+"""Shared test setup."""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+# Importing the package writes marshal sidecars under $XDG_CACHE_HOME. Point it
+# at a throwaway directory before any test module imports floral_arrangement_mcp,
+# so a test run never touches the developer's ~/.cache.
+_CACHE_HOME = tempfile.mkdtemp(prefix="floral-mcp-tests-")
+atexit.register(shutil.rmtree, _CACHE_HOME, ignore_errors=True)
+os.environ["XDG_CACHE_HOME"] = _CACHE_HOME
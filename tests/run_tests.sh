@@ -0,0 +1,5 @@
+#!/usr/bin/env bash
+# Run the test suite from the project root: ./tests/run_tests.sh [pytest args]
+set -euo pipefail
+cd "$(dirname "$0")/.."
+exec python -m pytest "$@"
@@ -0,0 +1,40 @@
+"""Priority rules of detect_arrangement_style."""
+
+import pytest
+
+from floral_arrangement_mcp import server
+
+
+@pytest.mark.parametrize("intent, expected", [
+    # moribana only counts alongside an ikebana cue
+    ("moribana", ("contemporary", "garden_style")),
+    ("japanese moribana", ("ikebana", "moribana")),
+    ("moribana ikebana", ("ikebana", "moribana")),
+    # nageire is the ikebana default; the word itself is not a cue
+    ("ikebana", ("ikebana", "nageire")),
+    ("japanese nageire", ("ikebana", "nageire")),
+    ("nageire", ("contemporary", "garden_style")),
+    # first matching rule wins, whatever the word order
+    ("romantic cascade", ("western_classical", "cascade")),
+    ("modern garden", ("contemporary", "minimalist")),
+    ("crescent dome", ("western_classical", "dome")),
+    ("cascade in the japanese manner", ("ikebana", "nageire")),
+    # substring cues, as before the rule table
+    ("a waterfall of orchids", ("western_classical", "cascade")),
+    ("surrounding curves", ("western_classical", "dome")),
+])
+def test_style_rules(intent, expected):
+    style = server.detect_arrangement_style(intent, "any")
+    assert (style["category"], style["type"]) == expected
+
+
+def test_preference_applies_only_without_cues():
+    style = server.detect_arrangement_style("something plain", "rikka")
+    assert (style["category"], style["type"]) == ("ikebana", "rikka")
+    style = server.detect_arrangement_style("a modern piece", "rikka")
+    assert (style["category"], style["type"]) == ("contemporary", "minimalist")
+
+
+def test_unknown_preference_falls_back_to_garden_style():
+    style = server.detect_arrangement_style("something plain", "no_such_style")
+    assert (style["category"], style["type"]) == ("contemporary", "garden_style")
@@ -0,0 +1,55 @@
+"""The keyword scanner must agree with plain substring tests."""
+
+import random
+
+import pytest
+
+from floral_arrangement_mcp import server, taxonomy
+
+
+def _keywords():
+    """The detector vocabulary, rebuilt from its sources rather than the scanner."""
+    keywords = set(server._STYLE_KEYWORDS + server._MOOD_KEYWORDS + server._SEASON_KEYWORDS)
+    keywords.update(taxonomy.COLOR_PALETTES)
+    for table in (taxonomy.FLOWERS_BY_ROLE, taxonomy.FOLIAGE_TYPES):
+        for entries in table.values():
+            keywords.update(name.replace("_", " ") for name in entries)
+    return keywords
+
+
+def _expected(text):
+    return frozenset(keyword for keyword in _keywords() if keyword in text)
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "a waterfall of orchids",          # "fall" inside "waterfall"
+    "romantic spring wedding bouquet",
+    "garden roses with spray roses",   # overlapping multi-word names
+    "baby breath and eucalyptus in a modern dome",
+    "fallfallfall",                    # repeated and adjacent matches
+    "no floral words here",
+])
+def test_scan_matches_substring_semantics(text):
+    assert server._scan_keywords(text) == _expected(text)
+
+
+def test_scanner_covers_the_whole_vocabulary():
+    assert set(server._KEYWORDS) == _keywords()
+    assert len(server._KEYWORDS) == len(set(server._KEYWORDS))
+
+
+def test_overlapping_keyword_is_reported():
+    hits = server._scan_keywords("a waterfall arrangement")
+    assert {"waterfall", "fall"} <= hits
+
+
+def test_scan_matches_substring_semantics_on_random_text():
+    rng = random.Random(1234)
+    vocabulary = sorted(_keywords()) + ["the", "with", "and", "x", "in", " "]
+    for _ in range(500):
+        # Glue words with and without spaces so keywords overlap and abut
+        text = "".join(
+            rng.choice(vocabulary) + rng.choice(["", " "]) for _ in range(rng.randint(1, 8))
+        )
+        assert server._scan_keywords(text) == _expected(text), text
@@ -0,0 +1,40 @@
+"""map_occasion's term index must agree with the original free-text scan."""
+
+import json
+from importlib.resources import files
+
+import pytest
+
+from floral_arrangement_mcp import server
+
+# OCCASIONS exactly as parsed from the packaged JSON (dicts of lists)
+RAW_OCCASIONS = json.loads(
+    (files("floral_arrangement_mcp") / "data" / "occasions.json").read_text(encoding="utf-8")
+)
+
+GENERAL = {"occasion": "general", "notes": "versatile arrangement suitable for various contexts"}
+
+
+def reference_map_occasion(occasion):
+    """The original implementation: exact key, else first occasion whose text contains it."""
+    if occasion in RAW_OCCASIONS:
+        return RAW_OCCASIONS[occasion]
+    for name, data in RAW_OCCASIONS.items():
+        if occasion in str(data).lower():
+            return {name: data}
+    return GENERAL
+
+
+def _as_plain(node):
+    return json.loads(json.dumps(node))
+
+
+PARTIAL_TERMS = [
+    "[", "]", "(", ")", "{", "'", ", ", ": ",
+    "wed", "ding", "sym", "  ", "", "xyz", "Wedding", "general",
+]
+
+
+@pytest.mark.parametrize("occasion", sorted(server._OCCASION_INDEX) + PARTIAL_TERMS)
+def test_map_occasion_matches_original_scan(occasion):
+    assert _as_plain(server.map_occasion(occasion, {})) == reference_map_occasion(occasion)
@@ -0,0 +1,182 @@
+"""Behavior tests for the taxonomy query helpers."""
+
+import pytest
+
+from floral_arrangement_mcp import taxonomy
+from floral_arrangement_mcp.taxonomy import Balance, Complexity
+
+COMPLEXITY_ORDER = ["low", "medium", "high", "very high"]
+
+
+def _all_styles():
+    return [
+        (family, name, attrs)
+        for family, styles in taxonomy.ARRANGEMENT_STYLES.items()
+        for name, attrs in styles.items()
+    ]
+
+
+# ----------------------------------------------------------------------------
+# query_styles
+# ----------------------------------------------------------------------------
+
+def test_query_styles_without_filters_lists_every_style_in_order():
+    assert taxonomy.query_styles() == tuple((family, name) for family, name, _ in _all_styles())
+
+
+def test_query_styles_by_balance_label():
+    assert taxonomy.query_styles(balance="radial symmetrical") == (("western_classical", "dome"),)
+
+
+def test_query_styles_mixed_balance_covers_both_mixed_labels():
+    assert taxonomy.query_styles(balance=Balance.MIXED) == tuple(
+        (family, name) for family, name, attrs in _all_styles()
+        if attrs["balance"] in ("symmetrical or asymmetrical", "often asymmetrical")
+    )
+
+
+@pytest.mark.parametrize("floor", COMPLEXITY_ORDER)
+def test_query_styles_min_complexity_matches_brute_force(floor):
+    expected = tuple(
+        (family, name) for family, name, attrs in _all_styles()
+        if COMPLEXITY_ORDER.index(attrs["complexity"]) >= COMPLEXITY_ORDER.index(floor)
+    )
+    assert taxonomy.query_styles(min_complexity=floor) == expected
+
+
+def test_query_styles_combines_filters():
+    assert taxonomy.query_styles(balance=Balance.ASYMMETRICAL, min_complexity=Complexity.HIGH) == (
+        ("ikebana", "moribana"),
+        ("western_classical", "cascade"),
+        ("western_classical", "hogarth"),
+    )
+
+
+def test_query_styles_rejects_unknown_label():
+    with pytest.raises(ValueError):
+        taxonomy.query_styles(balance="lopsided")
+
+
+def test_query_styles_rejects_members_of_the_other_enum():
+    with pytest.raises(TypeError):
+        taxonomy.query_styles(balance=Complexity.HIGH)
+    with pytest.raises(TypeError):
+        taxonomy.query_styles(min_complexity=Balance.RADIAL)
+
+
+# ----------------------------------------------------------------------------
+# Inverted indexes
+# ----------------------------------------------------------------------------
+
+def _all_flowers():
+    return [
+        (role, name, data)
+        for role, flowers in taxonomy.FLOWERS_BY_ROLE.items()
+        for name, data in flowers.items()
+    ]
+
+
+@pytest.mark.parametrize("season", ["spring", "late spring", "summer", "fall", "year-round"])
+def test_flowers_for_season_matches_brute_force(season):
+    expected = tuple(
+        (role, name) for role, name, data in _all_flowers() if season in data.get("seasons", ())
+    )
+    assert expected
+    assert taxonomy.flowers_for_season(season) == expected
+
+
+def test_flowers_for_symbolism_splits_comma_separated_terms():
+    assert taxonomy.flowers_for_symbolism("romance") == (("focal", "roses"), ("focal", "peonies"))
+
+
+def test_palettes_for_occasion():
+    assert taxonomy.palettes_for_occasion("wedding") == ("monochromatic", "romantic")
+    assert taxonomy.palettes_for_occasion("celebration") == (
+        "analogous", "complementary", "vibrant"
+    )
+
+
+def test_styles_for_balance_matches_brute_force():
+    for label in {attrs["balance"] for _, _, attrs in _all_styles()}:
+        expected = tuple(
+            (family, name) for family, name, attrs in _all_styles() if attrs["balance"] == label
+        )
+        assert taxonomy.styles_for_balance(label) == expected
+
+
+def test_unknown_index_keys_return_empty():
+    assert taxonomy.flowers_for_season("monsoon") == ()
+    assert taxonomy.flowers_for_symbolism("nothing") == ()
+    assert taxonomy.palettes_for_occasion("weddings") == ()
+    assert taxonomy.styles_for_balance("lopsided") == ()
+
+
+# ----------------------------------------------------------------------------
+# lookup
+# ----------------------------------------------------------------------------
+
+def _leaves(node, path):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from _leaves(value, path + (key,))
+    else:
+        yield path, node
+
+
+def test_lookup_matches_nested_access_for_every_leaf():
+    for table in taxonomy.TABLES:
+        for path, value in _leaves(getattr(taxonomy, table), (table.lower(),)):
+            assert taxonomy.lookup(*path) == value
+
+
+def test_lookup_example():
+    assert taxonomy.lookup("arrangement_styles", "ikebana", "moribana", "balance") == "asymmetrical"
+
+
+@pytest.mark.parametrize("path", [
+    ("arrangement_styles", "ikebana"),  # not a leaf
+    ("arrangement_styles", "ikebana", "moribana", "missing"),
+    ("ARRANGEMENT_STYLES", "ikebana", "moribana", "balance"),  # table names are lowercased
+])
+def test_lookup_raises_key_error_for_non_leaf_paths(path):
+    with pytest.raises(KeyError):
+        taxonomy.lookup(*path)
+
+
+# ----------------------------------------------------------------------------
+# Characteristic tags
+# ----------------------------------------------------------------------------
+
+def _words(text):
+    return set(taxonomy._TAG_TOKEN_RE.findall(text.lower()))
+
+
+def test_flowers_with_tags_matches_word_scan():
+    for words in (("tropical",), ("layered", "petals"), ("delicate",)):
+        expected = tuple(
+            (role, name) for role, name, data in _all_flowers()
+            if set(words) <= _words(data["characteristics"])
+        )
+        assert expected
+        assert tuple((f.role, f.name) for f in taxonomy.flowers_with_tags(*words)) == expected
+
+
+def test_foliage_with_tags_matches_word_scan():
+    expected = tuple(
+        name
+        for types in taxonomy.FOLIAGE_TYPES.values()
+        for name, data in types.items()
+        if "trailing" in _words(data["characteristics"])
+    )
+    assert tuple(f.name for f in taxonomy.foliage_with_tags("trailing")) == expected == ("ivy",)
+
+
+def test_tags_are_case_insensitive_and_whole_word():
+    assert taxonomy.flowers_with_tags("Tropical") == taxonomy.flowers_with_tags("tropical")
+    # "petal" is only ever part of "petals", so it is not a tag
+    assert taxonomy.flowers_with_tags("petal") == ()
+
+
+def test_unknown_tag_returns_empty():
+    assert taxonomy.flowers_with_tags("tropical", "no-such-word") == ()
+    assert taxonomy.foliage_with_tags("no-such-word") == ()
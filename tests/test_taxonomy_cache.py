@@ -0,0 +1,76 @@
+"""Tests for the marshal sidecar cache behind taxonomy._read_table."""
+
+import json
+import os
+
+import pytest
+
+from floral_arrangement_mcp import taxonomy
+
+STEM = "color_palettes"
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    """Point the loader at a private data dir and cache dir; return the JSON path."""
+    package = tmp_path / "pkg"
+    (package / "data").mkdir(parents=True)
+    path = package / "data" / f"{STEM}.json"
+    path.write_text(json.dumps({"spring": {"colors": ["pink"]}}))
+    monkeypatch.setattr(taxonomy, "files", lambda _package: package)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return path
+
+
+def _sidecar(path):
+    return taxonomy._cache_path(STEM, path.resolve())
+
+
+def test_first_read_writes_sidecar(source):
+    assert taxonomy._read_table(STEM) == {"spring": {"colors": ["pink"]}}
+    assert _sidecar(source).exists()
+
+
+def test_sidecar_is_used_while_source_is_unchanged(source, monkeypatch):
+    taxonomy._read_table(STEM)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("JSON parsed despite a valid sidecar")
+
+    monkeypatch.setattr(taxonomy.json, "loads", fail)
+    assert taxonomy._read_table(STEM) == {"spring": {"colors": ["pink"]}}
+
+
+def test_changed_source_with_older_mtime_is_reparsed(source):
+    taxonomy._read_table(STEM)
+    old = source.stat()
+    source.write_text(json.dumps({"spring": {"colors": ["pink"]}, "winter": {"colors": ["white"]}}))
+    # An upgraded install can carry an older mtime than the cached copy
+    os.utime(source, ns=(old.st_atime_ns, old.st_mtime_ns - 10**9))
+    assert set(taxonomy._read_table(STEM)) == {"spring", "winter"}
+
+
+def test_sidecar_is_specific_to_the_source_path(source, tmp_path):
+    other = tmp_path / "other" / f"{STEM}.json"
+    assert taxonomy._cache_path(STEM, source.resolve()) != taxonomy._cache_path(STEM, other)
+
+
+def test_corrupt_sidecar_falls_back_to_json(source):
+    taxonomy._read_table(STEM)
+    _sidecar(source).write_bytes(b"not marshal data")
+    assert taxonomy._read_table(STEM) == {"spring": {"colors": ["pink"]}}
+
+
+def test_foreign_sidecar_is_ignored(source):
+    taxonomy._read_table(STEM)
+    # Well-formed marshal data without the expected (key, data) layout
+    _sidecar(source).write_bytes(taxonomy.marshal.dumps({"spring": "stale"}))
+    assert taxonomy._read_table(STEM) == {"spring": {"colors": ["pink"]}}
+
+
+def test_unwritable_cache_dir_still_loads(source, tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(blocker))
+    assert taxonomy._read_table(STEM) == {"spring": {"colors": ["pink"]}}
+    assert taxonomy._read_table(STEM) == {"spring": {"colors": ["pink"]}}
@@ -0,0 +1,35 @@
+"""generate_floral_workflow output and the cached workflow JSON."""
+
+import json
+
+from floral_arrangement_mcp import server
+
+
+def test_workflow_json_is_absent_by_default():
+    result = server.generate_floral_workflow("red roses")
+    assert "workflow_json" not in result
+
+
+def test_workflow_json_matches_workflow_when_requested():
+    result = server.generate_floral_workflow(
+        "elegant orchid centerpiece", "768x1024", "sdxl", 25, include_workflow_json=True
+    )
+    assert result["workflow_json"] == json.dumps(result["workflow"], indent=2)
+
+
+def test_mutating_a_returned_workflow_does_not_leak_into_later_calls():
+    first = server.generate_floral_workflow("red roses", include_workflow_json=True)
+    first["workflow"]["5"]["inputs"]["seed"] = 42
+
+    second = server.generate_floral_workflow("red roses", include_workflow_json=True)
+    assert second["workflow"] is not first["workflow"]
+    assert second["workflow"]["5"]["inputs"]["seed"] == -1
+    assert json.loads(second["workflow_json"])["5"]["inputs"]["seed"] == -1
+    assert second["workflow_json"] == json.dumps(second["workflow"], indent=2)
+
+
+def test_documented_sizes_and_models():
+    result = server.generate_floral_workflow("tulips", "1536x1024", "sd15")
+    latent = result["workflow"]["4"]["inputs"]
+    assert (latent["width"], latent["height"]) == (1536, 1024)
+    assert result["workflow"]["1"]["inputs"]["ckpt_name"] == server.get_model_file("sd15")